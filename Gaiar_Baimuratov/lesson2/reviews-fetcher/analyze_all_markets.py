@@ -16,6 +16,7 @@ import os
 # Add app_review_analyzer to path
 sys.path.append(str(Path(__file__).parent / "app_review_analyzer"))
 from src.review_processor import (
+    load_country_files,
     chunk_reviews,
     extract_features_from_chunk,
     group_and_refine_features,
@@ -57,6 +58,10 @@ def analyze_reviews_file(file_path, output_dir=None):
         try:
             with open(file_path, "r", encoding="utf-8") as f:
                 data = json.load(f)
+
+            # All-markets files list per-country files instead of embedding reviews
+            if "results" not in data and "country_files" in data:
+                data["results"] = load_country_files(file_path, data["country_files"])
         except Exception as e:
             display_error(f"Failed to load JSON file: {e}")
             return None
@@ -9,7 +9,8 @@ This module provides functions to process app reviews, including:
 """
 
 import json
-from typing import List
+from pathlib import Path
+from typing import Any, Dict, List
 import os
 from dotenv import load_dotenv
 
@@ -25,22 +26,56 @@ if OPENAI_API_KEY:
     openai_client = openai.OpenAI(api_key=OPENAI_API_KEY)
 
 
+def load_country_files(
+    manifest_path: str, country_files: List[str]
+) -> List[Dict[str, Any]]:
+    """
+    Load the reviews from the per-country files listed in an all-markets manifest.
+
+    Args:
+        manifest_path: Path to the all-markets manifest; file names are relative to it.
+        country_files: Per-country file names from the manifest's "country_files".
+
+    Returns:
+        List of review dictionaries from all the country files.
+    """
+    reviews = []
+    base_dir = Path(manifest_path).parent
+    for file_name in country_files:
+        with open(base_dir / file_name, "r", encoding="utf-8") as f:
+            reviews.extend(json.load(f).get("results", []))
+    return reviews
+
+
 def load_reviews(file_path: str) -> List[str]:
     """
     Load reviews from a JSON file.
 
+    Accepts both a single reviews file and an all-markets manifest, whose
+    reviews live in the per-country files it lists.
+
     Args:
         file_path: Path to the JSON file containing reviews.
 
     Returns:
         List of review text strings.
+
+    Raises:
+        ValueError: If the file has neither "results" nor "country_files".
     """
     with open(file_path, "r", encoding="utf-8") as f:
         data = json.load(f)
 
+    if "results" in data:
+        results = data["results"]
+    elif "country_files" in data:
+        results = load_country_files(file_path, data["country_files"])
+    else:
+        raise ValueError(f"No reviews found in {file_path}")
+
     # Extract just the review text
     reviews = []
-    for review in data.get("results", []):
+    for review in results:
         if review.get("body"):  # Make sure there's actual review text
             reviews.append(review["body"])
 
@@ -3,7 +3,7 @@ UI utilities for rich terminal output and progress tracking.
 """
 
 import time
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional
 
 from rich.console import Console
 from rich.panel import Panel
@@ -197,17 +197,23 @@ def generate_llm_summary(data: Dict[str, Any], openai_client) -> str:
 class TimedOperation:
     """Context manager for timing operations."""
 
-    def __init__(self, description: str, console: Optional[Console] = None):
+    def __init__(
+        self,
+        description: str,
+        console: Optional[Console] = None,
+        clock: Callable[[], float] = time.time,
+    ):
         self.description = description
         self.console = console or globals()["console"]
+        self.clock = clock
 
     def __enter__(self):
-        self.start = time.time()
+        self.start = self.clock()
         self.console.print(f"[bold blue]Starting: {self.description}...[/bold blue]")
         return self
 
     def __exit__(self, *args):
-        elapsed = time.time() - self.start
+        elapsed = self.clock() - self.start
         self.console.print(
             f"[bold green]Completed: {self.description} in {format_duration(elapsed)}[/bold green]"
         )
@@ -7,6 +7,8 @@ import json
 import tempfile
 from unittest.mock import patch, MagicMock
 
+import pytest
+
 from src.review_processor import (
     load_reviews,
     chunk_reviews,
@@ -42,6 +44,29 @@ def test_load_reviews():
         os.unlink(temp_file)
 
 
+def test_load_reviews_from_all_markets_manifest():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for country, body in (("us", "US review"), ("de", "DE review")):
+            with open(os.path.join(temp_dir, f"reviews_{country}.json"), "w") as f:
+                json.dump({"results": [{"body": body}, {"body": ""}]}, f)
+
+        manifest = os.path.join(temp_dir, "all_markets_reviews.json")
+        with open(manifest, "w") as f:
+            json.dump({"country_files": ["reviews_us.json", "reviews_de.json"]}, f)
+
+        assert load_reviews(manifest) == ["US review", "DE review"]
+
+
+def test_load_reviews_without_results_raises():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "reviews.json")
+        with open(path, "w") as f:
+            json.dump({"app_id": "123"}, f)
+
+        with pytest.raises(ValueError):
+            load_reviews(path)
+
+
 def test_chunk_reviews_empty():
     """Test chunking with empty review list."""
     assert chunk_reviews([]) == []
@@ -5,14 +5,54 @@ A client for interacting with the AppBot API to retrieve app review data and ana
 """
 
 import os
+from functools import lru_cache
 from typing import Dict, List, Optional, Union
 
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup, fall back to requests' decoder
+    orjson = None
 
 load_dotenv()
 
 
+@lru_cache(maxsize=512)
+def _build_url(base_url: str, endpoint: str) -> str:
+    """
+    Build the full URL for an API endpoint.
+
+    Paginated calls hit the same endpoint over and over, so the result is cached.
+
+    Args:
+        base_url: Base URL of the API.
+        endpoint: API endpoint to request.
+
+    Returns:
+        Full URL for the endpoint.
+    """
+    return f"{base_url}/{endpoint}"
+
+
+def _decode_json(response: requests.Response) -> Dict:
+    """
+    Decode a JSON response body, using orjson when it is installed.
+
+    Args:
+        response: Response returned by the API.
+
+    Returns:
+        Decoded response body.
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
 class AppBotClient:
     """
     Client for interacting with the AppBot API.
@@ -20,13 +60,22 @@ class AppBotClient:
 
     BASE_URL = "https://api.appbot.co/api/v2"
 
-    def __init__(self, username: Optional[str] = None, password: Optional[str] = None):
+    def __init__(
+        self,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        pool_size: int = 10,
+    ):
         """
         Initialize the AppBot client.
 
+        The client keeps a single requests.Session, so it can be shared between
+        threads and reuses keep-alive connections across calls.
+
         Args:
             username: AppBot API username/key. If not provided, will look for APPBOT_API_USERNAME env var.
             password: AppBot API password. If not provided, will look for APPBOT_API_PASSWORD env var.
+            pool_size: Number of connections to keep open per host (default: 10).
         """
         self.username = username or os.environ.get("APPBOT_API_USERNAME")
         self.password = password or os.environ.get("APPBOT_API_PASSWORD")
@@ -37,6 +86,20 @@ class AppBotClient:
                 "(APPBOT_API_USERNAME and APPBOT_API_PASSWORD)."
             )
 
+        # Retry transient errors and rate limiting with exponential backoff
+        retries = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retries
+        )
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
     def _request(
         self,
         endpoint: str,
@@ -56,12 +119,12 @@ class AppBotClient:
         Returns:
             API response as a dictionary.
         """
-        url = f"{self.BASE_URL}/{endpoint}"
+        url = _build_url(self.BASE_URL, endpoint)
         auth = (self.username, self.password)
 
         try:
             # Ensure timeout is explicitly passed
-            response = requests.request(
+            response = self.session.request(
                 method,
                 url,
                 auth=auth,
@@ -69,7 +132,7 @@ class AppBotClient:
                 timeout=timeout,  # Make sure timeout is passed
             )
             response.raise_for_status()
-            return response.json()
+            return _decode_json(response)
         except requests.exceptions.HTTPError as e:
             print(f"API Error: {e}")
             print(f"Response: {response.text}")
@@ -77,7 +140,7 @@ class AppBotClient:
         except requests.exceptions.Timeout:
             print(f"Request timed out after {timeout} seconds. Retrying...")
             # Retry once with increased timeout
-            response = requests.request(
+            response = self.session.request(
                 method,
                 url,
                 auth=auth,
@@ -85,7 +148,7 @@ class AppBotClient:
                 timeout=timeout * 2,  # Make sure timeout is passed
             )
             response.raise_for_status()
-            return response.json()
+            return _decode_json(response)
 
     def get_token_info(self) -> Dict:
         """
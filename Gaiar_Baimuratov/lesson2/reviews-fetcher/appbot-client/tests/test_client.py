@@ -38,10 +38,11 @@ class TestAppBotClient(unittest.TestCase):
             with self.assertRaises(ValueError):
                 AppBotClient()
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
     def test_request(self, mock_request):
         mock_response = Mock()
         mock_response.json.return_value = {"key": "value"}
+        mock_response.content = b'{"key": "value"}'
         mock_request.return_value = mock_response
 
         result = self.client._request(
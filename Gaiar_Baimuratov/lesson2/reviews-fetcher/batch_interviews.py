@@ -15,10 +15,11 @@ import shutil
 import subprocess
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 from feature_adapter import (
-    load_features_from_file,
+    iter_features,
+    save_userboard_config,
 )
 
 # Set up logging
@@ -82,14 +83,17 @@ def process_feature_batch(
     dirs = setup_directories(output_dir)
     logger.info(f"Set up output directories in {output_dir}")
 
-    # Load features
-    features = load_features_from_file(features_file)
+    # Validate every feature up front, so a malformed entry anywhere in the
+    # file fails before any interview has run; only the first max_features
+    # are kept in memory
+    limit = max_features if max_features is not None and max_features > 0 else None
+    features = []
+    for feature in iter_features(features_file):
+        if limit is None or len(features) < limit:
+            features.append(feature)
     logger.info(f"Loaded {len(features)} features from {features_file}")
-
-    # Limit features if specified
-    if max_features is not None and max_features > 0:
-        features = features[:max_features]
-        logger.info(f"Limited to processing {len(features)} features")
+    if limit is not None:
+        logger.info(f"Limited to processing at most {max_features} features")
 
     # Process each feature
     results = []
@@ -106,8 +110,8 @@ def process_feature_batch(
         config_filename = f"feature_{i}_{safe_topic}.json"
         config_path = os.path.join(dirs["configs"], config_filename)
 
-        with open(config_path, "w", encoding="utf-8") as f:
-            json.dump(feature_config, f, indent=2, ensure_ascii=False)
+        # setup_directories already created the configs directory
+        save_userboard_config(feature_config, config_path, create_dirs=False)
 
         # Set up environment variables for UserBoard4
         env = os.environ.copy()
@@ -186,7 +190,7 @@ def process_feature_batch(
     # Generate summary
     summary = {
         "timestamp": dirs["timestamp"],
-        "total_features": len(features),
+        "total_features": len(results),
         "successful_interviews": sum(1 for r in results if r["status"] == "success"),
         "failed_interviews": sum(1 for r in results if r["status"] != "success"),
         "results": results,
@@ -209,8 +213,16 @@ def process_feature_batch(
     return summary
 
 
-def main():
-    """Main entry point for the batch processing script"""
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Main entry point for the batch processing script
+
+    Args:
+        argv: Command-line arguments (default: sys.argv[1:])
+
+    Returns:
+        Process exit code
+    """
     parser = argparse.ArgumentParser(
         description="Run batch interviews for feature requests"
     )
@@ -257,7 +269,7 @@ def main():
         default=None,
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Verify paths exist
     for path_name, path in [
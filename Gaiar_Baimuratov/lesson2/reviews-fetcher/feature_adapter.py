@@ -5,9 +5,35 @@ and UserBoard4 interview_config.json format.
 """
 import os
 import json
+import mmap
+import random
+import hashlib
+import time
 import logging
-from datetime import datetime
-from typing import Dict, List, Any, Tuple
+import operator
+from collections import deque
+from pathlib import Path
+from typing import Dict, Iterator, List, Any, Tuple
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup, fall back to stdlib json
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, MinHash falls back to pure Python
+    np = None
+
+try:
+    import fastjsonschema
+except ImportError:  # fastjsonschema is optional, validation falls back to itemgetter
+    fastjsonschema = None
+
+try:
+    import ijson
+except ImportError:  # ijson is optional, without it the whole file is decoded at once
+    ijson = None
 
 
 # Set up logging
@@ -17,42 +43,234 @@ logging.basicConfig(
 )
 logger = logging.getLogger("feature_adapter")
 
+# MinHash/LSH settings used by group_similar_features
+MINHASH_NUM_PERM = 132
+SHINGLE_SIZE = 8
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+# Fixed seed so the same features always group the same way between runs.
+# a and b stay below 2**32 so a * h + b fits in uint64 for the numpy path.
+_rng = random.Random(42)
+_PERMUTATIONS = [
+    (_rng.randint(1, _MAX_HASH), _rng.randint(0, _MAX_HASH))
+    for _ in range(MINHASH_NUM_PERM)
+]
+if np is not None:
+    _PERM_A = np.array([a for a, _ in _PERMUTATIONS], dtype=np.uint64)[:, None]
+    _PERM_B = np.array([b for _, b in _PERMUTATIONS], dtype=np.uint64)[:, None]
+
+
+def file_timestamp() -> str:
+    """
+    Format the current local time for use in output file names
+
+    Equivalent to datetime.now().strftime("%Y%m%d_%H%M%S") without building a
+    datetime object or going through strftime's format parser.
 
-def load_features_from_file(file_path: str) -> List[Dict[str, Any]]:
+    Returns:
+        Timestamp string such as "20250423_141502"
     """
-    Load features from the JSON file produced by analyze_all_markets.py
+    t = time.localtime()
+    return (
+        f"{t.tm_year:04d}{t.tm_mon:02d}{t.tm_mday:02d}_"
+        f"{t.tm_hour:02d}{t.tm_min:02d}{t.tm_sec:02d}"
+    )
+
+
+def _loads(data: bytes) -> Any:
+    """
+    Decode JSON bytes, using orjson when it is installed
 
     Args:
-        file_path: Path to the JSON file containing feature requests
+        data: Raw UTF-8 encoded JSON document
 
     Returns:
-        List of feature dictionaries with 'topic' and 'core_questions' keys
+        Decoded Python object
     """
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"Feature file not found: {file_path}")
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _load_json_file(file_path: str) -> Any:
+    """
+    Decode a JSON file
+
+    With orjson the file is memory-mapped and parsed straight from the mapped
+    pages, without first copying its contents into a bytes object.
+
+    Args:
+        file_path: Path to the JSON file
+
+    Returns:
+        Decoded Python object
+    """
+    if orjson is None or os.path.getsize(file_path) == 0:
+        # Binary read: the JSON decoder handles UTF-8 itself, so there is no
+        # separate text-mode decoding pass
+        return _loads(Path(file_path).read_bytes())
+
+    with open(file_path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
+
+def _dumps_pretty(obj: Any) -> bytes:
+    """
+    Encode an object as 2-space indented UTF-8 JSON, using orjson when installed
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _validate_feature(feature: Any) -> None:
+    """
+    Check that a single feature entry has the structure UserBoard4 expects
+
+    Args:
+        feature: Feature entry decoded from the features file
+
+    Raises:
+        ValueError: If the entry is not a dictionary with the expected keys
+    """
+    if not isinstance(feature, dict):
+        raise ValueError("Each feature should be a dictionary")
+    if "topic" not in feature:
+        raise ValueError("Each feature should have a 'topic' key")
+    if "core_questions" not in feature:
+        raise ValueError("Each feature should have a 'core_questions' key")
+
+
+# Same rules as _validate_feature, for whole-list validation in one call
+FEATURES_SCHEMA = {
+    "type": "array",
+    "items": {"type": "object", "required": ["topic", "core_questions"]},
+}
+
+if fastjsonschema is not None:
+    # Compiled once at import into a generated validator function
+    _check_features = fastjsonschema.compile(FEATURES_SCHEMA)
+    _CHECK_ERRORS = (fastjsonschema.JsonSchemaException,)
+else:
+    # itemgetter raises KeyError/TypeError for anything that is not a dict
+    # with both keys, checked in a C-level loop
+    _REQUIRED_KEYS = operator.itemgetter("topic", "core_questions")
+
+    def _check_features(features: List[Any]) -> None:
+        deque(map(_REQUIRED_KEYS, features), maxlen=0)
+
+    _CHECK_ERRORS = (KeyError, TypeError)
+
+
+def _validate_features(features: List[Any]) -> None:
+    """
+    Validate a whole list of decoded features
+
+    The common all-valid case is checked in one go, with the compiled
+    FEATURES_SCHEMA when fastjsonschema is installed or a C-level pass of
+    operator.itemgetter otherwise; only if that fails are the entries
+    re-checked one by one to report which rule was broken.
 
+    Args:
+        features: Feature entries decoded from the features file
+
+    Raises:
+        ValueError: If any entry is not a dictionary with the expected keys
+    """
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            features = json.load(f)
+        _check_features(features)
+    except _CHECK_ERRORS:
+        for feature in features:
+            _validate_feature(feature)
+
 
-        # Validate that it's a list of dictionaries with expected keys
-        if not isinstance(features, list):
+def _iter_features_streaming(file_path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Stream features out of the JSON array with ijson, one record at a time
+
+    Args:
+        file_path: Path to the JSON file containing feature requests
+
+    Yields:
+        Raw (not yet validated) feature entries
+    """
+    with open(file_path, "rb") as f:
+        # ijson silently yields nothing for a non-array document, so check
+        # the first significant byte ourselves
+        first = f.read(1)
+        while first and first in b" \t\r\n":
+            first = f.read(1)
+        if first != b"[":
             raise ValueError(
                 "Features file should contain a list of feature dictionaries"
             )
+        f.seek(0)
 
-        for feature in features:
-            if not isinstance(feature, dict):
-                raise ValueError("Each feature should be a dictionary")
-            if "topic" not in feature:
-                raise ValueError("Each feature should have a 'topic' key")
-            if "core_questions" not in feature:
-                raise ValueError("Each feature should have a 'core_questions' key")
+        try:
+            yield from ijson.items(f, "item", use_float=True)
+        except ijson.JSONError:
+            raise ValueError(f"Invalid JSON format in {file_path}")
 
-        return features
-    except json.JSONDecodeError:
+
+def iter_features(file_path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily iterate over features from the JSON file produced by analyze_all_markets.py
+
+    When ijson is installed the file is parsed incrementally and each feature
+    is validated right before it is yielded, so callers that only need the
+    first N features (e.g. via itertools.islice) never touch the rest.
+    Otherwise the whole document is decoded and validated in one pass first.
+
+    Args:
+        file_path: Path to the JSON file containing feature requests
+
+    Yields:
+        Feature dictionaries with 'topic' and 'core_questions' keys
+    """
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"Feature file not found: {file_path}")
+
+    if ijson is not None:
+        for feature in _iter_features_streaming(file_path):
+            _validate_feature(feature)
+            yield feature
+        return
+
+    try:
+        features = _load_json_file(file_path)
+    except ValueError:
+        # Covers json/orjson decode errors as well as invalid UTF-8
         raise ValueError(f"Invalid JSON format in {file_path}")
 
+    # Validate that it's a list of dictionaries with expected keys
+    if not isinstance(features, list):
+        raise ValueError("Features file should contain a list of feature dictionaries")
+
+    _validate_features(features)
+    yield from features
+
+
+def load_features_from_file(file_path: str) -> List[Dict[str, Any]]:
+    """
+    Load features from the JSON file produced by analyze_all_markets.py
+
+    Args:
+        file_path: Path to the JSON file containing feature requests
+
+    Returns:
+        List of feature dictionaries with 'topic' and 'core_questions' keys
+    """
+    return list(iter_features(file_path))
+
 
 def convert_to_userboard_format(
     features: List[Dict[str, Any]], max_followups: int = 2
@@ -86,28 +304,178 @@ def convert_to_userboard_format(
     return userboard_config
 
 
-def save_userboard_config(config: Dict[str, Any], output_file: str) -> None:
+def save_userboard_config(
+    config: Dict[str, Any], output_file: str, create_dirs: bool = True
+) -> None:
     """
     Save the UserBoard4 config to a JSON file
 
     Args:
         config: Dictionary with UserBoard4 config
         output_file: Path to save the JSON file
+        create_dirs: Create the parent directory first (skip when the caller
+            already created it, e.g. when writing many configs in a batch)
+    """
+    if create_dirs:
+        os.makedirs(os.path.dirname(os.path.abspath(output_file)), exist_ok=True)
+
+    with open(output_file, "wb") as f:
+        f.write(_dumps_pretty(config))
+
+    logger.info(f"Saved UserBoard4 config to {output_file}")
+
+
+def save_features_to_file(features: List[Dict[str, Any]], output_file: str) -> None:
     """
+    Save a list of features in the format read by load_features_from_file
+
+    Args:
+        features: List of feature dictionaries with 'topic' and 'core_questions' keys
+        output_file: Path to save the JSON file
+    """
+    with open(output_file, "wb") as f:
+        f.write(_dumps_pretty(features))
+
+
+def splice_userboard_config(
+    input_file: str, output_file: str, max_followups: int = 2
+) -> None:
+    """
+    Write a UserBoard4 config by splicing the raw features array into it
+
+    The features array is copied verbatim instead of being re-serialized, so
+    the input must already be validated (e.g. by load_features_from_file).
+
+    Args:
+        input_file: Path to the JSON file from analyze_all_markets.py
+        output_file: Path to save the JSON file
+        max_followups: Maximum number of follow-up questions per feature
+    """
+    features_json = Path(input_file).read_bytes().strip()
+
+    if not features_json.startswith(b"["):
+        raise ValueError("Features file should contain a list of feature dictionaries")
+
     os.makedirs(os.path.dirname(os.path.abspath(output_file)), exist_ok=True)
 
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(config, f, indent=2, ensure_ascii=False)
+    with open(output_file, "wb") as f:
+        f.write(b'{\n  "features": ')
+        f.write(features_json)
+        f.write(f',\n  "max_followups": {int(max_followups)}\n}}'.encode("utf-8"))
 
     logger.info(f"Saved UserBoard4 config to {output_file}")
 
 
+def _feature_shingles(feature: Dict[str, Any]) -> set:
+    """
+    Build the set of character shingles describing a feature
+
+    Args:
+        feature: Feature dictionary with 'topic' and 'core_questions' keys
+
+    Returns:
+        Set of SHINGLE_SIZE-character substrings of the normalized feature text
+    """
+    text = " ".join(
+        [feature["topic"], *(str(q) for q in feature["core_questions"])]
+    ).lower()
+    text = " ".join(text.split())
+
+    if len(text) <= SHINGLE_SIZE:
+        return {text}
+    return {text[i : i + SHINGLE_SIZE] for i in range(len(text) - SHINGLE_SIZE + 1)}
+
+
+def _minhash_signature(shingles: set) -> Tuple[int, ...]:
+    """
+    Compute the MinHash signature of a shingle set
+
+    Each shingle is hashed once; the MINHASH_NUM_PERM permutations are derived
+    from that hash with universal hashing ((a * h + b) mod p). With numpy the
+    permutations are applied to all shingles at once as a single array op.
+
+    Args:
+        shingles: Set of shingle strings
+
+    Returns:
+        Tuple of MINHASH_NUM_PERM minimum hash values
+    """
+    hashes = [
+        int.from_bytes(hashlib.sha1(s.encode("utf-8")).digest()[:4], "little")
+        for s in shingles
+    ]
+
+    if np is not None:
+        h = np.array(hashes, dtype=np.uint64)[None, :]
+        permuted = ((_PERM_A * h + _PERM_B) % np.uint64(_MERSENNE_PRIME)) & np.uint64(
+            _MAX_HASH
+        )
+        return tuple(permuted.min(axis=1).tolist())
+
+    return tuple(
+        min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+        for a, b in _PERMUTATIONS
+    )
+
+
+def _lsh_params(threshold: float, num_perm: int) -> Tuple[int, int]:
+    """
+    Pick the LSH (bands, rows) split whose S-curve midpoint is closest to threshold
+
+    Args:
+        threshold: Target Jaccard similarity
+        num_perm: Number of MinHash permutations available
+
+    Returns:
+        Tuple of (bands, rows_per_band)
+    """
+    best = (1, num_perm)
+    best_error = float("inf")
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        error = abs((1 / bands) ** (1 / rows) - threshold)
+        if error < best_error:
+            best, best_error = (bands, rows), error
+    return best
+
+
+def _remove_exact_duplicates(features: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Drop features whose content is identical to an earlier feature
+
+    Args:
+        features: List of feature dictionaries
+
+    Returns:
+        List of features keeping the first occurrence of each distinct feature
+    """
+    unique: Dict[bytes, Dict[str, Any]] = {}
+    for feature in features:
+        digest = hashlib.md5(
+            json.dumps(feature, sort_keys=True, ensure_ascii=False).encode("utf-8")
+        ).digest()
+        unique.setdefault(digest, feature)
+
+    removed = len(features) - len(unique)
+    if removed:
+        logger.info(f"Exact-dedup removed {removed} features")
+
+    return list(unique.values())
+
+
 def group_similar_features(
     features: List[Dict[str, Any]], similarity_threshold: float = 0.75
 ) -> List[Dict[str, Any]]:
     """
     Group similar features to avoid redundant interviews
 
+    Exact duplicates are dropped first with a content hash, which is cheap and
+    catches repeated rows without any similarity work. Remaining
+    near-duplicates are found with MinHash + LSH over character shingles of the
+    topic and core questions. Candidate pairs sharing an LSH band are confirmed
+    against the estimated Jaccard similarity, merged with union-find, and each
+    group is represented by the feature with the most core questions.
+
     Args:
         features: List of feature dictionaries
         similarity_threshold: Threshold for considering features similar (0.0-1.0)
@@ -115,11 +483,47 @@ def group_similar_features(
     Returns:
         List of deduplicated feature dictionaries
     """
-    # This is a placeholder for now - in a real implementation, you would use
-    # NLP techniques to calculate similarity between feature topics and questions
+    features = _remove_exact_duplicates(features)
+    if len(features) < 2:
+        return features
 
-    # For now, we'll just return the original features
-    return features
+    signatures = [_minhash_signature(_feature_shingles(f)) for f in features]
+    bands, rows = _lsh_params(similarity_threshold, MINHASH_NUM_PERM)
+
+    # Union-find over feature indexes
+    parent = list(range(len(features)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = {}
+    for i, signature in enumerate(signatures):
+        for band in range(bands):
+            key = (band, signature[band * rows : (band + 1) * rows])
+            buckets.setdefault(key, []).append(i)
+
+    for members in buckets.values():
+        for pos, a in enumerate(members):
+            for b in members[pos + 1 :]:
+                root_a, root_b = find(a), find(b)
+                if root_a == root_b:
+                    continue
+                matches = sum(x == y for x, y in zip(signatures[a], signatures[b]))
+                if matches / MINHASH_NUM_PERM >= similarity_threshold:
+                    parent[max(root_a, root_b)] = min(root_a, root_b)
+
+    # Keep groups in order of first appearance, one representative each
+    groups: Dict[int, List[int]] = {}
+    for i in range(len(features)):
+        groups.setdefault(find(i), []).append(i)
+
+    return [
+        features[max(members, key=lambda i: (len(features[i]["core_questions"]), -i))]
+        for members in groups.values()
+    ]
 
 
 def create_interview_config_for_feature_batch(
@@ -154,11 +558,15 @@ def create_interview_config_for_feature_batch(
 
     # Generate output file path if not provided
     if output_file is None:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = file_timestamp()
         output_file = f"interview_config_{timestamp}.json"
 
-    # Save to file
-    save_userboard_config(config, output_file)
+    # Save to file. Ungrouped features are unchanged, so their raw bytes can
+    # be spliced into the config instead of re-serializing every feature.
+    if group_similar:
+        save_userboard_config(config, output_file)
+    else:
+        splice_userboard_config(input_file, output_file, max_followups)
 
     return config, output_file
 
@@ -11,11 +11,27 @@ This script coordinates:
 import os
 import sys
 import logging
+import json
 import argparse
+import importlib
+import contextlib
+import threading
 import subprocess
-from datetime import datetime
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple, Union
+
+from feature_adapter import (
+    file_timestamp,
+    load_features_from_file,
+    save_features_to_file,
+)
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, JSONL logs fall back to stdlib json
+    orjson = None
 
 # Set up logging
 logging.basicConfig(
@@ -24,10 +40,139 @@ logging.basicConfig(
 )
 logger = logging.getLogger("process_all_features")
 
+# Directory containing this script and the stage scripts it runs
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_USERBOARD_DIR = os.path.join(os.path.dirname(_HERE), "userboard")
+
+
+class JsonlLogHandler(logging.Handler):
+    """
+    Logging handler that appends one compact JSON object per record to a file
+
+    Records are serialized straight to bytes (with orjson when installed) and
+    written through a large binary buffer, bypassing logging.Formatter.
+    """
+
+    def __init__(self, log_path: str, buffer_size: int = 1 << 16):
+        super().__init__()
+        self.stream = open(log_path, "ab", buffering=buffer_size)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            entry = {
+                "t": record.created,
+                "lvl": record.levelname,
+                "logger": record.name,
+                "msg": record.getMessage(),
+            }
+            if orjson is not None:
+                line = orjson.dumps(entry) + b"\n"
+            else:
+                line = json.dumps(entry, ensure_ascii=False).encode("utf-8") + b"\n"
+            self.stream.write(line)
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            if self.stream and not self.stream.closed:
+                self.stream.flush()
+        finally:
+            self.release()
+
+    def close(self) -> None:
+        self.acquire()
+        try:
+            if self.stream and not self.stream.closed:
+                self.stream.close()
+        finally:
+            self.release()
+            super().close()
+
+
+def run_streaming(cmd: List[str], stderr_tail_lines: int = 20) -> None:
+    """
+    Run a command, forwarding its stdout and stderr to the log line by line
+
+    Unlike subprocess.run(capture_output=True), output is never buffered in
+    full: each line is logged as soon as the child writes it, and only the
+    last few stderr lines are kept for error reporting.
+
+    Args:
+        cmd: Command and arguments to run
+        stderr_tail_lines: Number of trailing stderr lines to keep
+
+    Raises:
+        subprocess.CalledProcessError: If the command exits with a non-zero code
+            (its stderr attribute holds the trailing stderr lines)
+    """
+    stderr_tail = deque(maxlen=stderr_tail_lines)
+
+    def forward(stream, tail=None):
+        for line in stream:
+            line = line.rstrip()
+            logger.info("%s", line)
+            if tail is not None:
+                tail.append(line)
+
+    with subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        bufsize=1,
+    ) as process:
+        readers = [
+            threading.Thread(target=forward, args=(process.stdout,), daemon=True),
+            threading.Thread(
+                target=forward, args=(process.stderr, stderr_tail), daemon=True
+            ),
+        ]
+        for reader in readers:
+            reader.start()
+        for reader in readers:
+            reader.join()
+        returncode = process.wait()
+
+    if returncode:
+        raise subprocess.CalledProcessError(
+            returncode, cmd, stderr="\n".join(stderr_tail)
+        )
+
+
+def run_stage(script_name: str, argv: List[str], isolated: bool = False) -> None:
+    """
+    Run a pipeline stage script with the given command-line arguments
+
+    By default the script is imported and its main(argv) is called in-process,
+    which avoids interpreter start-up and re-import cost for every stage. With
+    isolated=True the script runs in a child interpreter instead, so a crash in
+    the stage cannot take the orchestrator down with it.
+
+    Args:
+        script_name: File name of the stage script (e.g. "batch_interviews.py")
+        argv: Command-line arguments for the script
+        isolated: Run the script in a subprocess instead of in-process
+
+    Raises:
+        subprocess.CalledProcessError: If the stage exits with a non-zero code
+    """
+    if isolated:
+        script_path = os.path.join(_HERE, script_name)
+        run_streaming([sys.executable, script_path, *argv])
+        return
+
+    module = importlib.import_module(Path(script_name).stem)
+    returncode = module.main(argv)
+    if returncode:
+        raise subprocess.CalledProcessError(returncode, [script_name, *argv])
+
 
 def run_feature_extraction(
     review_data_file: str,
     output_dir: str,
+    isolated: bool = False,
 ) -> str:
     """
     Run analyze_all_markets.py to extract features from reviews
@@ -35,48 +180,181 @@ def run_feature_extraction(
     Args:
         review_data_file: Path to the reviews data file
         output_dir: Directory to store output
+        isolated: Run the extraction in a subprocess instead of in-process
 
     Returns:
         Path to the extracted features file
     """
-    logger.info(f"Running feature extraction on {review_data_file}")
+    logger.info("Running feature extraction on %s", review_data_file)
 
     # Create output directory if it doesn't exist
     os.makedirs(output_dir, exist_ok=True)
 
+    if not isolated:
+        # analyze_all_markets exposes a typer entry point, so call the
+        # analysis function directly; it returns the features file path
+        from analyze_all_markets import analyze_reviews_file
+
+        features_file = analyze_reviews_file(review_data_file, output_dir)
+        if features_file is None:
+            raise RuntimeError(f"Feature extraction failed for {review_data_file}")
+
+        logger.info("Found features file: %s", features_file)
+        return str(features_file)
+
     # Run analyze_all_markets.py
-    script_path = os.path.join(os.path.dirname(__file__), "analyze_all_markets.py")
+    script_path = os.path.join(_HERE, "analyze_all_markets.py")
 
     try:
-        process = subprocess.run(
-            [sys.executable, script_path, review_data_file],
-            check=True,
-            capture_output=True,
-            text=True,
+        run_streaming(
+            [
+                sys.executable,
+                script_path,
+                review_data_file,
+                "--output-dir",
+                output_dir,
+            ]
         )
-
-        # Extract the output file path from the output
-        output = process.stdout
-        logger.info(f"Feature extraction completed: {output}")
-
-        # Look for the features file in the output directory
-        features_files = list(Path(output_dir).glob("features_*.json"))
-        if not features_files:
+        logger.info("Feature extraction completed")
+
+        # Find the most recently written features file in the output directory;
+        # DirEntry caches its stat result, so each candidate is stat()ed once
+        with os.scandir(output_dir) as entries:
+            latest = max(
+                (
+                    entry
+                    for entry in entries
+                    if entry.name.startswith("features_")
+                    and entry.name.endswith(".json")
+                ),
+                key=lambda entry: entry.stat().st_mtime,
+                default=None,
+            )
+        if latest is None:
             raise FileNotFoundError(f"No features file found in {output_dir}")
 
-        # Get the most recently created file
-        features_file = str(max(features_files, key=lambda x: x.stat().st_mtime))
-        logger.info(f"Found features file: {features_file}")
+        features_file = latest.path
+        logger.info("Found features file: %s", features_file)
 
         return features_file
 
     except subprocess.CalledProcessError as e:
-        logger.error(f"Error running feature extraction: {e}")
-        logger.error(f"Stdout: {e.stdout}")
-        logger.error(f"Stderr: {e.stderr}")
+        logger.error("Error running feature extraction: %s", e)
+        if e.stderr:
+            logger.error("Stderr: %s", e.stderr)
         raise RuntimeError(f"Feature extraction failed: {e}")
 
 
+@contextlib.contextmanager
+def _output_to_file(log_path: str):
+    """
+    Send stdout and all logging to log_path for the duration of the block
+
+    Args:
+        log_path: File that receives the console and log output
+    """
+    root = logging.getLogger()
+    saved_handlers = root.handlers[:]
+    with open(log_path, "w", encoding="utf-8") as log_file:
+        file_handler = logging.StreamHandler(log_file)
+        file_handler.setFormatter(
+            logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+        )
+        root.handlers = [file_handler]
+        try:
+            with contextlib.redirect_stdout(log_file):
+                yield
+        finally:
+            root.handlers = saved_handlers
+
+
+def _run_shard_extraction(review_data_file: str, shard_dir: str, isolated: bool) -> str:
+    """
+    Run feature extraction for one shard with its output sent to a log file
+
+    Shards run at once in worker processes; each one's rich progress output
+    and log lines go to <shard_dir>/extraction.log so they cannot interleave
+    on the terminal.
+
+    Args:
+        review_data_file: Path to the reviews data file
+        shard_dir: Output directory for this shard
+        isolated: Run the extraction in a subprocess instead of in-process
+
+    Returns:
+        Path to the extracted features file
+    """
+    os.makedirs(shard_dir, exist_ok=True)
+    with _output_to_file(os.path.join(shard_dir, "extraction.log")):
+        return run_feature_extraction(review_data_file, shard_dir, isolated)
+
+
+def run_parallel_feature_extraction(
+    review_data_files: List[str],
+    output_dir: str,
+    isolated: bool = False,
+) -> str:
+    """
+    Extract features from several review data files at once and merge them
+
+    Each file is analyzed in its own worker process (and its own output
+    subdirectory, so same-second output names cannot collide). Each worker's
+    console and log output is written to extraction.log in its subdirectory.
+    The resulting feature lists are concatenated into a single features file
+    that the interview stage can consume.
+
+    Args:
+        review_data_files: Paths to the reviews data files
+        output_dir: Directory to store output
+        isolated: Run each extraction in a subprocess instead of in-process
+
+    Returns:
+        Path to the merged features file
+    """
+    if len(review_data_files) == 1:
+        return run_feature_extraction(review_data_files[0], output_dir, isolated)
+
+    logger.info(
+        "Running feature extraction on %d review files in parallel",
+        len(review_data_files),
+    )
+
+    shard_dirs = [
+        os.path.join(output_dir, f"shard_{i}")
+        for i in range(1, len(review_data_files) + 1)
+    ]
+    max_workers = min(len(review_data_files), os.cpu_count() or 1)
+    logger.info("Shard output is logged to extraction.log in each shard directory")
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        features_files = list(
+            executor.map(
+                _run_shard_extraction,
+                review_data_files,
+                shard_dirs,
+                [isolated] * len(review_data_files),
+            )
+        )
+
+    # Merge the per-shard features into one file for the interview stage
+    features = []
+    for features_file in features_files:
+        features.extend(load_features_from_file(features_file))
+
+    timestamp = file_timestamp()
+    merged_file = os.path.join(output_dir, f"features_merged_{timestamp}.json")
+    save_features_to_file(features, merged_file)
+
+    logger.info(
+        "Merged %d features from %d files into %s",
+        len(features),
+        len(features_files),
+        merged_file,
+    )
+
+    return merged_file
+
+
 def run_batch_interviews(
     features_file: str,
     personas_file: str,
@@ -84,6 +362,7 @@ def run_batch_interviews(
     userboard_script_path: str,
     max_followups: int = 2,
     max_features: Optional[int] = None,
+    isolated: bool = False,
 ) -> str:
     """
     Run batch_interviews.py to conduct interviews for each feature
@@ -95,18 +374,15 @@ def run_batch_interviews(
         userboard_script_path: Path to the userboard4 script
         max_followups: Maximum number of follow-up questions per feature
         max_features: Maximum number of features to process (for testing)
+        isolated: Run the interviews in a subprocess instead of in-process
 
     Returns:
         Path to the interview transcripts directory
     """
-    logger.info(f"Running batch interviews for {features_file}")
+    logger.info("Running batch interviews for %s", features_file)
 
     # Run batch_interviews.py
-    script_path = os.path.join(os.path.dirname(__file__), "batch_interviews.py")
-
-    cmd = [
-        sys.executable,
-        script_path,
+    argv = [
         features_file,
         "--personas",
         personas_file,
@@ -119,15 +395,10 @@ def run_batch_interviews(
     ]
 
     if max_features is not None:
-        cmd.extend(["--max-features", str(max_features)])
+        argv.extend(["--max-features", str(max_features)])
 
     try:
-        subprocess.run(
-            cmd,
-            check=True,
-            capture_output=True,
-            text=True,
-        )
+        run_stage("batch_interviews.py", argv, isolated)
 
         logger.info("Batch interviews completed")
 
@@ -141,15 +412,16 @@ def run_batch_interviews(
         return transcripts_dir
 
     except subprocess.CalledProcessError as e:
-        logger.error(f"Error running batch interviews: {e}")
-        logger.error(f"Stdout: {e.stdout}")
-        logger.error(f"Stderr: {e.stderr}")
+        logger.error("Error running batch interviews: %s", e)
+        if e.stderr:
+            logger.error("Stderr: %s", e.stderr)
         raise RuntimeError(f"Batch interviews failed: {e}")
 
 
 def run_report_generation(
     transcripts_dir: str,
     output_dir: str,
+    isolated: bool = False,
 ) -> Tuple[str, str]:
     """
     Run report_generator.py to create consolidated reports
@@ -157,55 +429,51 @@ def run_report_generation(
     Args:
         transcripts_dir: Directory containing interview transcripts
         output_dir: Directory to store reports
+        isolated: Run the report generator in a subprocess instead of in-process
 
     Returns:
         Tuple of (json_report_path, markdown_report_path)
     """
-    logger.info(f"Generating reports from {transcripts_dir}")
+    logger.info("Generating reports from %s", transcripts_dir)
 
     # Create output directory if it doesn't exist
     os.makedirs(output_dir, exist_ok=True)
 
     # Run report_generator.py
-    script_path = os.path.join(os.path.dirname(__file__), "report_generator.py")
-
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = file_timestamp()
     json_report_path = os.path.join(output_dir, f"consolidated_report_{timestamp}.json")
     markdown_report_path = os.path.join(
         output_dir, f"consolidated_report_{timestamp}.md"
     )
 
     try:
-        subprocess.run(
+        run_stage(
+            "report_generator.py",
             [
-                sys.executable,
-                script_path,
                 transcripts_dir,
                 "--output-json",
                 json_report_path,
                 "--output-markdown",
                 markdown_report_path,
             ],
-            check=True,
-            capture_output=True,
-            text=True,
+            isolated,
         )
 
         logger.info("Report generation completed")
-        logger.info(f"JSON report: {json_report_path}")
-        logger.info(f"Markdown report: {markdown_report_path}")
+        logger.info("JSON report: %s", json_report_path)
+        logger.info("Markdown report: %s", markdown_report_path)
 
         return json_report_path, markdown_report_path
 
     except subprocess.CalledProcessError as e:
-        logger.error(f"Error generating reports: {e}")
-        logger.error(f"Stdout: {e.stdout}")
-        logger.error(f"Stderr: {e.stderr}")
+        logger.error("Error generating reports: %s", e)
+        if e.stderr:
+            logger.error("Stderr: %s", e.stderr)
         raise RuntimeError(f"Report generation failed: {e}")
 
 
 def process_all_features(
-    review_data_file: str,
+    review_data_file: Union[str, List[str]],
     output_dir: str,
     personas_file: str,
     userboard_script_path: str,
@@ -215,12 +483,14 @@ def process_all_features(
     features_file: Optional[str] = None,
     skip_interviews: bool = False,
     transcripts_dir: Optional[str] = None,
+    isolated: bool = False,
 ) -> Dict[str, Any]:
     """
     Process all features from review data to final reports
 
     Args:
-        review_data_file: Path to the reviews data file
+        review_data_file: Path to the reviews data file, or a list of paths
+            whose features are extracted in parallel and merged
         output_dir: Directory to store all output
         personas_file: Path to the personas CSV file
         userboard_script_path: Path to the userboard4 script
@@ -230,11 +500,12 @@ def process_all_features(
         features_file: Path to a pre-existing features file (if skipping extraction)
         skip_interviews: Skip interviews (use transcripts_dir instead)
         transcripts_dir: Path to a pre-existing transcripts directory (if skipping interviews)
+        isolated: Run each stage in its own subprocess instead of in-process
 
     Returns:
         Dictionary with results and paths
     """
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = file_timestamp()
     results = {
         "timestamp": timestamp,
         "output_dir": output_dir,
@@ -254,7 +525,14 @@ def process_all_features(
 
     # Step 1: Feature extraction
     if not skip_extraction:
-        features_file = run_feature_extraction(review_data_file, features_dir)
+        review_data_files = (
+            [review_data_file]
+            if isinstance(review_data_file, str)
+            else list(review_data_file)
+        )
+        features_file = run_parallel_feature_extraction(
+            review_data_files, features_dir, isolated
+        )
     elif features_file is None or not os.path.exists(features_file):
         raise ValueError(
             "Must provide a valid features_file when skip_extraction is True"
@@ -271,6 +549,7 @@ def process_all_features(
             userboard_script_path,
             max_followups,
             max_features,
+            isolated,
         )
     elif transcripts_dir is None or not os.path.exists(transcripts_dir):
         raise ValueError(
@@ -281,7 +560,7 @@ def process_all_features(
 
     # Step 3: Report generation
     json_report_path, markdown_report_path = run_report_generation(
-        transcripts_dir, reports_dir
+        transcripts_dir, reports_dir, isolated
     )
 
     results["json_report_path"] = json_report_path
@@ -299,7 +578,8 @@ def main():
     parser.add_argument(
         "--review-data",
         "-r",
-        help="Path to the reviews data file",
+        help="Path to the reviews data file (several files are extracted in parallel)",
+        nargs="+",
         default=None,
     )
 
@@ -314,20 +594,14 @@ def main():
         "--personas",
         "-p",
         help="Path to the personas CSV file",
-        default=os.path.join(
-            os.path.dirname(os.path.dirname(__file__)), "userboard", "personas.csv"
-        ),
+        default=os.path.join(_USERBOARD_DIR, "personas.csv"),
     )
 
     parser.add_argument(
         "--userboard-script",
         "-u",
         help="Path to the userboard4 script",
-        default=os.path.join(
-            os.path.dirname(os.path.dirname(__file__)),
-            "userboard",
-            "userboard4-baimuratov.py",
-        ),
+        default=os.path.join(_USERBOARD_DIR, "userboard4-baimuratov.py"),
     )
 
     parser.add_argument(
@@ -374,6 +648,18 @@ def main():
         default=None,
     )
 
+    parser.add_argument(
+        "--isolated",
+        help="Run each stage in its own subprocess (crash containment)",
+        action="store_true",
+    )
+
+    parser.add_argument(
+        "--log-jsonl",
+        help="Also write structured JSONL logs (one object per record) to this file",
+        default=None,
+    )
+
     args = parser.parse_args()
 
     # Validate arguments
@@ -388,6 +674,12 @@ def main():
             "--transcripts-dir is required when --skip-interviews is specified"
         )
 
+    # Structured logs cover the orchestrator and every in-process stage
+    jsonl_handler = None
+    if args.log_jsonl:
+        jsonl_handler = JsonlLogHandler(args.log_jsonl)
+        logging.getLogger().addHandler(jsonl_handler)
+
     # Process all features
     try:
         results = process_all_features(
@@ -401,6 +693,7 @@ def main():
             features_file=args.features_file,
             skip_interviews=args.skip_interviews,
             transcripts_dir=args.transcripts_dir,
+            isolated=args.isolated,
         )
 
         # Print summary
@@ -414,10 +707,15 @@ def main():
         return 0
 
     except Exception as e:
-        logger.exception(f"Error processing features: {e}")
+        logger.exception("Error processing features: %s", e)
         print(f"\nError: {e}", file=sys.stderr)
         return 1
 
+    finally:
+        if jsonl_handler is not None:
+            logging.getLogger().removeHandler(jsonl_handler)
+            jsonl_handler.close()
+
 
 if __name__ == "__main__":
     sys.exit(main())
@@ -4,14 +4,23 @@ Script to pull reviews from all markets for the past 365 days.
 Enhanced with rich UI for better progress visualization.
 Uses parallel fetching for improved performance.
 """
+import os
 import sys
 import json
 import time
+import queue
+import threading
 import concurrent.futures
+from collections import Counter
 from datetime import datetime, timedelta
 from pathlib import Path
 import typer
-from typing import Optional
+from typing import Any, Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup, fall back to stdlib json
+    orjson = None
 
 # Add appbot-client to path
 sys.path.append(str(Path(__file__).parent / "appbot-client"))
@@ -33,6 +42,110 @@ from src.ui_utils import (
 )
 
 
+def _dumps(obj: Any, pretty: bool = False) -> bytes:
+    """
+    Encode an object as UTF-8 JSON, using orjson when installed
+
+    Args:
+        obj: JSON-serializable object
+        pretty: Indent the output with 2 spaces instead of writing it compactly
+
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _write_all(fd: int, chunks: List[bytes]) -> None:
+    """
+    Write byte chunks to a file descriptor, with a single writev call when possible
+
+    Args:
+        fd: Open file descriptor
+        chunks: Byte strings to write in order
+    """
+    views = [memoryview(chunk) for chunk in chunks if chunk]
+    while views:
+        if hasattr(os, "writev"):
+            written = os.writev(fd, views)
+        else:
+            written = os.write(fd, views[0])
+
+        # Drop fully written chunks and trim a partially written one
+        while views and written >= len(views[0]):
+            written -= len(views[0])
+            views.pop(0)
+        if views and written:
+            views[0] = views[0][written:]
+
+
+def _write_reviews_json(
+    path: Path, payload: Dict[str, Any], pretty: bool = False
+) -> None:
+    """
+    Write a reviews payload as JSON with one compact review per line
+
+    The metadata fields are encoded once and each review in "results" is
+    encoded on its own line, so large files are written without building
+    an indented copy of the whole document. The output is still a single
+    JSON object that json.load reads back unchanged. Payloads without a
+    "results" key, and every payload when pretty is set, are written as a
+    single object.
+
+    Args:
+        path: Destination file path
+        payload: Dictionary with metadata fields and an optional "results" list
+        pretty: Write the whole document 2-space indented for human readers
+    """
+    if pretty:
+        header, body, footer = _dumps(payload, pretty=True), b"", b"\n"
+    elif "results" in payload:
+        meta = {key: value for key, value in payload.items() if key != "results"}
+        header = _dumps(meta)[:-1] + (b',"results":[\n' if meta else b'"results":[\n')
+        body = b",\n".join(map(_dumps, payload["results"]))
+        footer = b"\n]}\n"
+    else:
+        header, body, footer = _dumps(payload), b"", b"\n"
+
+    # Hand the three parts to the kernel together instead of concatenating them
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        _write_all(fd, [header, body, footer])
+    finally:
+        os.close(fd)
+
+
+def _json_writer(write_q: queue.Queue, pretty: bool = False) -> None:
+    """
+    Drain (path, payload) tuples from a queue and write them as JSON files
+
+    Runs on a dedicated thread so disk writes overlap with review fetching.
+    A None item stops the writer.
+
+    Args:
+        write_q: Queue of (path, payload) tuples
+        pretty: Write indented JSON instead of compact JSON
+    """
+    while True:
+        item = write_q.get()
+        try:
+            if item is None:
+                return
+            path, payload = item
+            _write_reviews_json(path, payload, pretty)
+        except Exception as e:
+            display_error(f"Error writing {item[0]}: {e}")
+        finally:
+            write_q.task_done()
+
+
 def get_all_countries(client, app_id):
     """Get all available countries for an app."""
     with TimedOperation(f"Fetching available countries for app {app_id}"):
@@ -53,10 +166,15 @@ def get_all_countries(client, app_id):
         return countries
 
 
-def fetch_country_reviews(client, app_id, country, start_date, end_date, progress=None):
+def fetch_country_reviews(
+    client, app_id, country, start_date, end_date, progress=None, page_executor=None
+):
     """
     Fetch reviews for a single country.
 
+    Page 1 is fetched first to learn the page count. The remaining pages are
+    then fetched concurrently on page_executor when one is given.
+
     Args:
         client: AppBotClient instance
         app_id: App ID to fetch reviews for
@@ -64,79 +182,91 @@ def fetch_country_reviews(client, app_id, country, start_date, end_date, progres
         start_date: Start date string in YYYY-MM-DD format
         end_date: End date string in YYYY-MM-DD format
         progress: Optional progress tracker for rich UI
+        page_executor: Optional executor used to fetch pages 2..N in parallel
 
     Returns:
         Tuple containing (country_name, country_id, reviews_list, stats_dict)
     """
     country_id = country["id"]
     country_name = country["name"]
-    country_reviews = []
-    page = 1
-    total_pages = 1
-
-    # Track statistics for this country
-    language_stats = {}
-    rating_stats = {1: 0, 2: 0, 3: 0, 4: 0, 5: 0}
-
-    # Create a page task if progress is provided
     page_task = None
-    if progress:
-        page_task = progress.add_task(
-            f"[cyan]Fetching pages for {country_name}", total=None, visible=True
-        )
 
-    while page <= total_pages:
-        try:
-            reviews = client.get_reviews(
-                app_id=app_id,
-                start=start_date,
-                end=end_date,
-                country=country_id,
-                page=page,
-            )
-
-            results = reviews.get("results", [])
-            country_reviews.extend(results)
-            total_pages = reviews.get("total_pages", 1)
+    def fetch_page(page):
+        reviews = client.get_reviews(
+            app_id=app_id,
+            start=start_date,
+            end=end_date,
+            country=country_id,
+            page=page,
+        )
 
-            # Update progress bar with total pages after first response
-            if page == 1 and progress and page_task:
-                progress.update(page_task, total=total_pages)
+        # Update page progress
+        if progress and page_task:
+            progress.update(page_task, advance=1)
 
-            # Update page progress
-            if progress and page_task:
-                progress.update(page_task, advance=1)
+        return reviews
 
-            # Increment page
-            page += 1
+    try:
+        reviews = fetch_page(1)
+        page_results = [reviews.get("results", [])]
+        total_pages = reviews.get("total_pages", 1)
+
+        # Small markets often have no reviews at all; skip the page task for them
+        if not page_results[0] and total_pages <= 1:
+            stats = {
+                "count": 0,
+                "pages": total_pages,
+                "language_stats": {},
+                "rating_stats": {1: 0, 2: 0, 3: 0, 4: 0, 5: 0},
+            }
+            return country_name, country_id, [], stats
+
+        # Create the page task once page 1 has revealed the page count
+        if progress:
+            page_task = progress.add_task(
+                f"[cyan]Fetching pages for {country_name}",
+                total=total_pages,
+                completed=1,
+                visible=True,
+            )
 
-            # Break early if there are no more pages
-            if page > total_pages:
-                break
+        # Fetch the remaining pages, keeping them in page order
+        remaining = range(2, total_pages + 1)
+        if page_executor is not None:
+            pages = page_executor.map(fetch_page, remaining)
+        else:
+            pages = map(fetch_page, remaining)
+        page_results.extend(reviews.get("results", []) for reviews in pages)
 
-        except Exception as e:
-            if progress and page_task:
-                progress.update(page_task, visible=False)
-            return country_name, country_id, [], {"error": str(e)}
+    except Exception as e:
+        if progress and page_task:
+            progress.update(page_task, visible=False)
+        return country_name, country_id, [], {"error": str(e)}
 
     # Hide page progress task after completion
     if progress and page_task:
         progress.update(page_task, visible=False)
 
-    # Process review data for statistics
-    for review in country_reviews:
-        # Track ratings
-        rating = review.get("rating")
-        if rating and 1 <= rating <= 5:
-            rating_stats[rating] += 1
+    # Size the list once from the page lengths instead of growing it per page
+    country_reviews = [None] * sum(map(len, page_results))
+    start = 0
+    for results in page_results:
+        country_reviews[start : start + len(results)] = results
+        start += len(results)
+
+    # Count ratings and languages in one C-level pass each
+    ratings = Counter(review.get("rating") for review in country_reviews)
+    rating_stats = {rating: ratings[rating] for rating in range(1, 6)}
 
-        # Track languages
-        language = review.get("detected_language")
-        if language:
-            language_stats[language] = language_stats.get(language, 0) + 1
+    language_stats = Counter(
+        review.get("detected_language") for review in country_reviews
+    )
+    language_stats.pop(None, None)
+    language_stats.pop("", None)
 
     stats = {
         "count": len(country_reviews),
+        "pages": total_pages,
         "language_stats": language_stats,
         "rating_stats": rating_stats,
     }
@@ -144,7 +274,55 @@ def fetch_country_reviews(client, app_id, country, start_date, end_date, progres
     return country_name, country_id, country_reviews, stats
 
 
-def pull_all_markets_reviews(app_id, days=365, max_workers=5):
+def iter_country_results(
+    client, app_id, countries, start_date, end_date, progress=None, max_workers=5
+):
+    """
+    Fetch reviews for all countries in parallel, yielding each as it completes.
+
+    Args:
+        client: AppBotClient instance shared by all workers
+        app_id: App ID to fetch reviews for
+        countries: List of country dictionaries with 'id' and 'name' keys
+        start_date: Start date string in YYYY-MM-DD format
+        end_date: End date string in YYYY-MM-DD format
+        progress: Optional progress tracker for rich UI
+        max_workers: Maximum number of parallel worker threads
+
+    Yields:
+        Tuples of (country_name, country_id, reviews_list, stats_dict) in
+        completion order; failed countries carry an "error" key in stats
+    """
+    # Pages get their own pool so country workers never wait on themselves
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_workers
+    ) as executor, concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_workers
+    ) as page_executor:
+        # Submit every country up front so a slow one never holds up the rest
+        future_to_country = {
+            executor.submit(
+                fetch_country_reviews,
+                client,
+                app_id,
+                country,
+                start_date,
+                end_date,
+                progress,  # Pass progress for UI updates
+                page_executor,
+            ): country
+            for country in countries
+        }
+
+        for future in concurrent.futures.as_completed(future_to_country):
+            try:
+                yield future.result()
+            except Exception as e:
+                country = future_to_country[future]
+                yield country["name"], country["id"], [], {"error": str(e)}
+
+
+def pull_all_markets_reviews(app_id, days=365, max_workers=5, pretty=False):
     """
     Pull reviews from all markets in parallel for specified days.
 
@@ -152,16 +330,22 @@ def pull_all_markets_reviews(app_id, days=365, max_workers=5):
         app_id: AppBot app ID
         days: Number of days back to fetch reviews
         max_workers: Maximum number of parallel worker threads
+        pretty: Write indented JSON files instead of compact ones
     """
     # Display header
     display_header(f"REVIEW DATA COLLECTION - APP ID: {app_id}")
 
     with TimedOperation("Initializing AppBot client"):
-        client = AppBotClient()
+        # One client is shared by the country and page workers
+        client = AppBotClient(pool_size=max_workers * 2)
 
     # Calculate date range
-    end_date = datetime.now().strftime("%Y-%m-%d")
-    start_date = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+    now = datetime.now()
+    end_date = now.strftime("%Y-%m-%d")
+    start_date = (now - timedelta(days=days)).strftime("%Y-%m-%d")
+
+    # One timestamp names every file written by this run
+    run_ts = now.strftime("%Y%m%d_%H%M%S")
 
     display_section(f"Date Range: {start_date} to {end_date} ({days} days)")
 
@@ -174,14 +358,20 @@ def pull_all_markets_reviews(app_id, days=365, max_workers=5):
     display_info(f"Output directory: {output_dir}")
 
     # Prepare for reviews collection
-    all_reviews = []
+    total_count = 0
+    country_files = []
     total_per_country = {}
-    language_stats = {}
-    rating_stats = {1: 0, 2: 0, 3: 0, 4: 0, 5: 0}
+    language_stats = Counter()
+    rating_stats = Counter({1: 0, 2: 0, 3: 0, 4: 0, 5: 0})
 
     # Display parallel processing info
     display_section(f"Parallel Processing with {max_workers} workers")
-    display_info(f"Processing {len(countries)} countries in parallel batches")
+    display_info(f"Processing {len(countries)} countries in parallel")
+
+    # Per-country files are written on a separate thread. The queue is
+    # bounded so fetched reviews cannot pile up faster than they are written.
+    write_q = queue.Queue(maxsize=max_workers)
+    threading.Thread(target=_json_writer, args=(write_q, pretty), daemon=True).start()
 
     # Setup progress bars - using a single progress instance for all tasks
     with create_progress() as progress:
@@ -190,115 +380,67 @@ def pull_all_markets_reviews(app_id, days=365, max_workers=5):
             "[bold green]Countries progress", total=len(countries)
         )
 
-        # Process countries in parallel using ThreadPoolExecutor
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Create a client for each worker to avoid thread safety issues
-            clients = [AppBotClient() for _ in range(max_workers)]
-
-            # Create futures for each country batch
-            country_batches = [
-                countries[i : i + max_workers]
-                for i in range(0, len(countries), max_workers)
-            ]
-
-            # Process countries in batches to show progress effectively
-            for batch_num, batch in enumerate(country_batches):
-                display_info(
-                    f"Processing batch {batch_num+1}/{len(country_batches)} ({len(batch)} countries)"
+        review_rate_start = time.time()
+        rate_reviews = 0
+
+        # Process countries as they complete
+        for country_name, country_id, country_reviews, stats in iter_country_results(
+            client, app_id, countries, start_date, end_date, progress, max_workers
+        ):
+            if "error" in stats:
+                display_error(f"Error processing {country_name}: {stats['error']}")
+            elif country_reviews:
+                review_count = stats["count"]
+                display_success(
+                    f"{country_name}: {review_count} reviews "
+                    f"across {stats['pages']} pages"
                 )
 
-                # Submit all countries in this batch to the thread pool
-                future_to_country = {
-                    executor.submit(
-                        fetch_country_reviews,
-                        clients[
-                            i % max_workers
-                        ],  # Use different client for each worker
-                        app_id,
-                        country,
-                        start_date,
-                        end_date,
-                        progress,  # Pass progress for UI updates
-                    ): country
-                    for i, country in enumerate(batch)
+                # Update statistics
+                total_per_country[country_name] = review_count
+                total_count += review_count
+                rate_reviews += review_count
+
+                # Merge language and rating stats
+                language_stats.update(stats["language_stats"])
+                rating_stats.update(stats["rating_stats"])
+
+                # Save progress to a temporary file
+                temp_output = {
+                    "app_id": app_id,
+                    "country": country_name,
+                    "country_id": country_id,
+                    "start_date": start_date,
+                    "end_date": end_date,
+                    "total_count": review_count,
+                    "results": country_reviews,
                 }
 
-                review_rate_start = time.time()
-                batch_reviews = 0
-
-                # Process completed futures as they arrive
-                for future in concurrent.futures.as_completed(future_to_country):
-                    country = future_to_country[future]
-                    country_name = country["name"]
-                    country_id = country["id"]
-
-                    try:
-                        # Get results from the future
-                        country_name, country_id, country_reviews, stats = (
-                            future.result()
-                        )
-
-                        # Track statistics
-                        if country_reviews:
-                            display_success(
-                                f"Fetched {len(country_reviews)} reviews for {country_name}"
-                            )
-
-                            # Update statistics
-                            total_per_country[country_name] = len(country_reviews)
-                            all_reviews.extend(country_reviews)
-                            batch_reviews += len(country_reviews)
-
-                            # Merge language stats
-                            for lang, count in stats["language_stats"].items():
-                                language_stats[lang] = (
-                                    language_stats.get(lang, 0) + count
-                                )
-
-                            # Merge rating stats
-                            for rating, count in stats["rating_stats"].items():
-                                rating_stats[rating] += count
-
-                            # Save progress to a temporary file
-                            temp_output = {
-                                "app_id": app_id,
-                                "country": country_name,
-                                "country_id": country_id,
-                                "start_date": start_date,
-                                "end_date": end_date,
-                                "total_count": len(country_reviews),
-                                "results": country_reviews,
-                            }
-
-                            country_file = (
-                                output_dir
-                                / f"reviews_{app_id}_{country_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-                            )
-                            with open(country_file, "w", encoding="utf-8") as f:
-                                json.dump(temp_output, f, indent=2, ensure_ascii=False)
-
-                            display_success(
-                                f"Saved {len(country_reviews)} reviews to {country_file.name}"
-                            )
-                        else:
-                            display_warning(f"No reviews found for {country_name}")
-
-                        # Calculate and show review rate
-                        elapsed = time.time() - review_rate_start
-                        if elapsed > 5:  # Update rate calculation every 5 seconds
-                            reviews_per_minute = batch_reviews / (elapsed / 60)
-                            if reviews_per_minute > 0:
-                                display_info(
-                                    f"Current rate: {reviews_per_minute:.1f} reviews/minute"
-                                )
-                                review_rate_start = time.time()
-                                batch_reviews = 0
-
-                    except Exception as e:
-                        display_error(f"Error processing {country_name}: {e}")
-
-                    # Update overall progress
-                    progress.update(country_task, advance=1)
+                country_file = (
+                    output_dir / f"reviews_{app_id}_{country_id}_{run_ts}.json"
+                )
+                write_q.put((country_file, temp_output))
+                country_files.append(country_file.name)
+            else:
+                display_warning(f"No reviews found for {country_name}")
+
+            # Calculate and show review rate
+            elapsed = time.time() - review_rate_start
+            if elapsed > 5:  # Update rate calculation every 5 seconds
+                reviews_per_minute = rate_reviews / (elapsed / 60)
+                if reviews_per_minute > 0:
+                    display_info(
+                        f"Current rate: {reviews_per_minute:.1f} reviews/minute"
+                    )
+                    review_rate_start = time.time()
+                    rate_reviews = 0
+
+            # Update overall progress
+            progress.update(country_task, advance=1)
+
+    # Wait for pending per-country writes before the final save
+    write_q.put(None)
+    write_q.join()
 
     # Display statistics so far
     display_section("Collection Statistics")
@@ -317,9 +459,7 @@ def pull_all_markets_reviews(app_id, days=365, max_workers=5):
     if language_stats:
         language_stats_data = [
             {"Language": lang, "Count": count}
-            for lang, count in sorted(
-                language_stats.items(), key=lambda x: x[1], reverse=True
-            )
+            for lang, count in language_stats.most_common()
         ]
         display_stats_table("Reviews by Language", language_stats_data)
 
@@ -328,36 +468,33 @@ def pull_all_markets_reviews(app_id, days=365, max_workers=5):
         {
             "Rating": rating,
             "Count": count,
-            "Percentage": f"{count / max(1, len(all_reviews)) * 100:.1f}%",
+            "Percentage": f"{count / max(1, total_count) * 100:.1f}%",
         }
         for rating, count in sorted(rating_stats.items(), reverse=True)
     ]
     if rating_stats_data:
         display_stats_table("Reviews by Rating", rating_stats_data)
 
-    # Prepare final output data with all reviews
+    # Prepare the final manifest; reviews stay in the per-country files
     output = {
         "app_id": app_id,
         "start_date": start_date,
         "end_date": end_date,
-        "total_count": len(all_reviews),
+        "total_count": total_count,
+        "country_files": country_files,
         "country_stats": total_per_country,
         "language_stats": language_stats,
         "rating_stats": rating_stats,
-        "results": all_reviews,
     }
 
     # Save to final file
     with TimedOperation("Saving final output file"):
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_file = output_dir / f"all_markets_reviews_{app_id}_{timestamp}.json"
-
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(output, f, indent=2, ensure_ascii=False)
+        output_file = output_dir / f"all_markets_reviews_{app_id}_{run_ts}.json"
+        _write_reviews_json(output_file, output, pretty)
 
     # Final summary
     summary_text = f"""
-    • Total Reviews: {len(all_reviews)}
+    • Total Reviews: {total_count}
     • Countries: {len(total_per_country)} (of {len(countries)} available)
     • Languages: {len(language_stats)}
     • Date Range: {start_date} to {end_date} ({days} days)
@@ -376,6 +513,9 @@ def main(
     android_app: Optional[str] = typer.Option(
         None, help="Android app name (for preset IDs)"
     ),
+    pretty: bool = typer.Option(
+        False, "--pretty/--no-pretty", help="Write indented JSON for human reading"
+    ),
 ):
     """
     Pull app reviews from all markets for the specified period using parallel processing.
@@ -405,7 +545,7 @@ def main(
 
     # Pull reviews
     try:
-        output_file = pull_all_markets_reviews(app_id, days, workers)
+        output_file = pull_all_markets_reviews(app_id, days, workers, pretty)
         return output_file
     except Exception as e:
         display_error(f"An error occurred: {str(e)}")
@@ -8,12 +8,21 @@ created by the batch_interviews.py process.
 
 import os
 import re
+import sys
 import json
 import logging
-from typing import Dict, Any, Optional
+import tempfile
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Set
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup, fall back to stdlib json
+    orjson = None
+
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
@@ -21,6 +30,56 @@ logging.basicConfig(
 )
 logger = logging.getLogger("report_generator")
 
+# Transcript section patterns, compiled once for all transcripts. _HEADER_RE
+# picks up every header section in one scan; the individual patterns are the
+# fallback for transcripts whose sections are missing or out of order.
+_HEADER_RE = re.compile(
+    r"# Interview Transcript: (?P<topic>[^\n]*?)\n"
+    r".*?\*\*Decision: (?P<decision>[^\n]*?)\*\*"
+    r".*?## Market Perspective\n\n(?P<perspective>.*?)\n\n(?=##)"
+    r".*?## Key Rationale\n\n(?P<rationale>.*?)\n\n##",
+    re.DOTALL,
+)
+_TOPIC_RE = re.compile(r"# Interview Transcript: (.*?)\n")
+_DECISION_RE = re.compile(r"\*\*Decision: (.*?)\*\*")
+_PERSPECTIVE_RE = re.compile(r"## Market Perspective\n\n(.*?)\n\n##", re.DOTALL)
+_RATIONALE_RE = re.compile(r"## Key Rationale\n\n(.*?)\n\n##", re.DOTALL)
+_PERSONA_RE = re.compile(
+    r"### (?P<name>.*?) - (?P<sentiment>.*?)\n\n"
+    r"\*\*Summary:\*\* (?P<summary>.*?)\n\n"
+    r"\*\*Key Points:\*\*\n(?P<points>(?:- .*?\n)*)"
+)
+
+# One markdown list item per line: skips blank lines, drops the "- " marker
+_BULLET_RE = re.compile(r"\s*(?=\S)[- ]*(.*?)\s*$")
+
+# Persona sentiments counted as-is; anything else is tallied as UNKNOWN
+_VALID_SENTIMENTS = frozenset(("POSITIVE", "NEUTRAL", "NEGATIVE"))
+_ZERO_STATS = {"POSITIVE": 0, "NEUTRAL": 0, "NEGATIVE": 0, "UNKNOWN": 0}
+
+# Sidecar file in the transcripts directory with parse results from earlier runs
+PARSE_CACHE_NAME = ".parse_cache.json"
+
+# Bump when parse_transcript's output changes so older cache entries are ignored
+PARSE_CACHE_VERSION = 1
+
+# Output directories already created by this process
+_ensured_dirs: Set[Path] = set()
+
+
+def _bullet_points(text: str) -> List[str]:
+    """
+    Split a markdown bullet list into its items
+
+    Args:
+        text: Markdown list with one "- item" per line
+
+    Returns:
+        List of item texts without the bullet markers
+    """
+    matches = map(_BULLET_RE.match, text.split("\n"))
+    return [match.group(1) for match in matches if match]
+
 
 def parse_transcript(transcript_path: str) -> Dict[str, Any]:
     """
@@ -32,57 +91,49 @@ def parse_transcript(transcript_path: str) -> Dict[str, Any]:
     Returns:
         Dictionary with extracted information
     """
+    logger.debug(f"Parsing transcript: {transcript_path}")
     try:
-        with open(transcript_path, "r", encoding="utf-8") as f:
-            content = f.read()
+        content = Path(transcript_path).read_text(encoding="utf-8")
 
-        # Extract topic from header
-        topic_match = re.search(r"# Interview Transcript: (.*?)\n", content)
-        topic = topic_match.group(1) if topic_match else "Unknown Topic"
+        header_match = _HEADER_RE.search(content)
+        if header_match:
+            # Topic, decision, market perspective and rationale in one pass
+            topic, decision, perspective, rationale_text = header_match.group(
+                "topic", "decision", "perspective", "rationale"
+            )
+            perspective = perspective.strip()
+        else:
+            # Extract topic from header
+            topic_match = _TOPIC_RE.search(content)
+            topic = topic_match.group(1) if topic_match else "Unknown Topic"
+
+            # Extract decision (GO/NO-GO)
+            decision_match = _DECISION_RE.search(content)
+            decision = decision_match.group(1) if decision_match else "UNKNOWN"
+
+            # Extract market perspective
+            perspective_match = _PERSPECTIVE_RE.search(content)
+            perspective = (
+                perspective_match.group(1).strip() if perspective_match else ""
+            )
 
-        # Extract decision (GO/NO-GO)
-        decision_match = re.search(r"\*\*Decision: (.*?)\*\*", content)
-        decision = decision_match.group(1) if decision_match else "UNKNOWN"
+            # Extract key rationale section
+            rationale_section = _RATIONALE_RE.search(content)
+            rationale_text = rationale_section.group(1) if rationale_section else ""
 
-        # Extract market perspective
-        perspective_match = re.search(
-            r"## Market Perspective\n\n(.*?)\n\n##", content, re.DOTALL
-        )
-        perspective = perspective_match.group(1).strip() if perspective_match else ""
-
-        # Extract key rationale points
-        rationale_section = re.search(
-            r"## Key Rationale\n\n(.*?)\n\n##", content, re.DOTALL
-        )
-        rationale = []
-        if rationale_section:
-            rationale_text = rationale_section.group(1)
-            rationale = [
-                point.strip().lstrip("- ")
-                for point in rationale_text.split("\n")
-                if point.strip()
-            ]
+        # Split key rationale points
+        rationale = _bullet_points(rationale_text)
 
         # Extract persona sentiments
-        persona_sections = re.findall(
-            r"### (.*?) - (.*?)\n\n\*\*Summary:\*\* (.*?)\n\n\*\*Key Points:\*\*\n((?:- .*?\n)*)",
-            content,
-        )
-        personas = []
-        for name, sentiment, summary, points_text in persona_sections:
-            points = [
-                point.strip().lstrip("- ")
-                for point in points_text.split("\n")
-                if point.strip()
-            ]
-            personas.append(
-                {
-                    "name": name,
-                    "sentiment": sentiment,
-                    "summary": summary,
-                    "key_points": points,
-                }
-            )
+        personas = [
+            {
+                "name": match.group("name"),
+                "sentiment": match.group("sentiment"),
+                "summary": match.group("summary"),
+                "key_points": _bullet_points(match.group("points")),
+            }
+            for match in _PERSONA_RE.finditer(content)
+        ]
 
         return {
             "topic": topic,
@@ -91,6 +142,7 @@ def parse_transcript(transcript_path: str) -> Dict[str, Any]:
             "rationale": rationale,
             "personas": personas,
             "transcript_path": transcript_path,
+            "transcript_basename": os.path.basename(transcript_path),
         }
 
     except Exception as e:
@@ -102,13 +154,61 @@ def parse_transcript(transcript_path: str) -> Dict[str, Any]:
             "rationale": [],
             "personas": [],
             "transcript_path": transcript_path,
+            "transcript_basename": os.path.basename(transcript_path),
             "error": str(e),
         }
 
 
+def _load_parse_cache(cache_path: str) -> Dict[str, Any]:
+    """
+    Load cached transcript parse results
+
+    Args:
+        cache_path: Path to the parse cache file
+
+    Returns:
+        Dictionary mapping "version:path:mtime_ns:size" keys to parse results
+    """
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_parse_cache(cache_path: str, cache: Dict[str, Any]) -> None:
+    """
+    Save transcript parse results for the next run
+
+    Args:
+        cache_path: Path to the parse cache file
+        cache: Dictionary mapping "version:path:mtime_ns:size" keys to parse results
+    """
+    # Write to a temp file and rename so concurrent runs never see a partial cache
+    try:
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(cache_path)), suffix=".tmp"
+        )
+    except OSError as e:
+        logger.debug(f"Could not write parse cache {cache_path}: {e}")
+        return
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(cache, f, ensure_ascii=False)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.debug(f"Could not write parse cache {cache_path}: {e}")
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
 def generate_consolidated_report(
     transcripts_dir: str,
     output_file: Optional[str] = None,
+    cache_dir: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Generate a consolidated report from multiple interview transcripts
@@ -116,28 +216,70 @@ def generate_consolidated_report(
     Args:
         transcripts_dir: Directory containing interview transcripts
         output_file: Path to save the consolidated report
+        cache_dir: Directory for the parse cache (default: output_file's
+            directory); without either, parse results are not cached
 
     Returns:
         Dictionary with consolidated report data
     """
-    # Find all transcript files
-    transcript_files = list(Path(transcripts_dir).glob("*.md"))
-    if not transcript_files:
+    # Find all transcript files; scandir entries carry their file type already
+    try:
+        with os.scandir(transcripts_dir) as it:
+            entries = [
+                entry for entry in it if entry.name.endswith(".md") and entry.is_file()
+            ]
+    except FileNotFoundError:
+        entries = []
+    paths = [entry.path for entry in entries]
+    if not paths:
         logger.warning(f"No transcript files found in {transcripts_dir}")
         return {"error": f"No transcript files found in {transcripts_dir}"}
 
-    logger.info(f"Found {len(transcript_files)} transcript files")
+    logger.info(f"Found {len(paths)} transcript files")
+
+    # Reuse parse results for transcripts unchanged since the last run; the
+    # cache lives with the output so the transcripts directory is never written
+    if cache_dir is None and output_file:
+        cache_dir = os.path.dirname(os.path.abspath(output_file))
+    cache_path = os.path.join(cache_dir, PARSE_CACHE_NAME) if cache_dir else None
+    cache = _load_parse_cache(cache_path) if cache_path else {}
+    keys = []
+    for entry in entries:
+        stat = entry.stat()
+        keys.append(
+            f"{PARSE_CACHE_VERSION}:{entry.path}:{stat.st_mtime_ns}:{stat.st_size}"
+        )
+    to_parse = [path for path, key in zip(paths, keys) if key not in cache]
+
+    # Parse the remaining transcripts concurrently so their file reads overlap
+    parsed = {}
+    if to_parse:
+        max_workers = min(32, (os.cpu_count() or 4) * 4, len(to_parse))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            parsed = dict(zip(to_parse, executor.map(parse_transcript, to_parse)))
+    logger.info(
+        f"Parsed {len(to_parse)} transcripts, {len(paths) - len(to_parse)} from cache"
+    )
 
-    # Parse each transcript
-    transcript_data = []
-    for file_path in transcript_files:
-        logger.info(f"Parsing transcript: {file_path}")
-        data = parse_transcript(str(file_path))
-        transcript_data.append(data)
+    transcript_data = [
+        cache[key] if key in cache else parsed[path] for path, key in zip(paths, keys)
+    ]
+
+    # Keep only current, successfully parsed transcripts in the cache
+    if cache_path and to_parse:
+        _save_parse_cache(
+            cache_path,
+            {
+                key: data
+                for key, data in zip(keys, transcript_data)
+                if "error" not in data
+            },
+        )
 
-    # Count decisions
-    go_count = sum(1 for data in transcript_data if data["decision"] == "GO")
-    no_go_count = sum(1 for data in transcript_data if data["decision"] == "NO-GO")
+    # Count decisions in a single pass
+    decisions = Counter(data["decision"] for data in transcript_data)
+    go_count = decisions["GO"]
+    no_go_count = decisions["NO-GO"]
     unknown_count = len(transcript_data) - go_count - no_go_count
 
     # Generate consolidated report
@@ -153,46 +295,93 @@ def generate_consolidated_report(
     }
 
     # Generate unique persona stats
-    persona_stats = {}
+    persona_stats = defaultdict(lambda: dict(_ZERO_STATS))
     for data in transcript_data:
         for persona in data["personas"]:
-            name = persona["name"]
             sentiment = persona["sentiment"]
-            if name not in persona_stats:
-                persona_stats[name] = {
-                    "POSITIVE": 0,
-                    "NEUTRAL": 0,
-                    "NEGATIVE": 0,
-                    "UNKNOWN": 0,
-                }
-
-            persona_stats[name][
-                (
-                    sentiment
-                    if sentiment in ["POSITIVE", "NEUTRAL", "NEGATIVE"]
-                    else "UNKNOWN"
-                )
-            ] += 1
-
-    report["persona_stats"] = persona_stats
+            key = sentiment if sentiment in _VALID_SENTIMENTS else "UNKNOWN"
+            persona_stats[persona["name"]][key] += 1
+
+    report["persona_stats"] = dict(persona_stats)
 
     # Save to file if specified
     if output_file:
-        os.makedirs(os.path.dirname(os.path.abspath(output_file)), exist_ok=True)
+        save_report_json(report, output_file)
+
+    return report
+
+
+def save_report_json(report: Dict[str, Any], output_file: str) -> None:
+    """
+    Save consolidated report data as indented JSON
+
+    Args:
+        report: Consolidated report data
+        output_file: Path to save the JSON report
+    """
+    parent = Path(output_file).resolve().parent
+    if parent not in _ensured_dirs:
+        parent.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(parent)
+    if orjson is not None:
+        with open(output_file, "wb") as f:
+            f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+    else:
         with open(output_file, "w", encoding="utf-8") as f:
             json.dump(report, f, indent=2, ensure_ascii=False)
-        logger.info(f"Saved consolidated report to {output_file}")
+    logger.info(f"Saved consolidated report to {output_file}")
 
-    return report
 
+def _summary_row(feature: Dict[str, Any]) -> str:
+    """
+    Format a feature as a row of the decision summary table
+
+    Args:
+        feature: Parsed transcript data for the feature
 
-def generate_markdown_report(report_data: Dict[str, Any], output_file: str) -> None:
+    Returns:
+        Markdown table row, with the market perspective truncated to 150 characters
     """
-    Generate a markdown report from consolidated report data
+    perspective = feature["market_perspective"]
+    if len(perspective) > 150:
+        perspective = f"{perspective[:150]}..."
+    return f"| {feature['topic']} | **{feature['decision']}** | {perspective} |\n"
+
+
+def _feature_details(feature: Dict[str, Any]) -> str:
+    """
+    Format the detail section of a feature
 
     Args:
-        report_data: Consolidated report data
-        output_file: Path to save the markdown report
+        feature: Parsed transcript data for the feature
+
+    Returns:
+        Markdown section with decision, rationale and persona feedback
+    """
+    rationale = "".join(f"- {point}\n" for point in feature["rationale"])
+    personas = "".join(
+        f"- **{persona['name']} ({persona['sentiment']})**: {persona['summary']}\n"
+        for persona in feature["personas"]
+    )
+    return (
+        f"### {feature['topic']}\n\n"
+        f"**Decision: {feature['decision']}**\n\n"
+        f"**Market Perspective:**\n{feature['market_perspective']}\n\n"
+        f"**Key Rationale:**\n{rationale}"
+        f"\n**Persona Feedback:**\n\n{personas}"
+        f"\n[Full Transcript]({feature['transcript_basename']})\n\n"
+        "---\n\n"
+    )
+
+
+def _write_report_sections(w, writelines, report_data: Dict[str, Any]) -> None:
+    """
+    Write the summary, persona and feature sections of the markdown report
+
+    Args:
+        w: Write function of the open report file
+        writelines: Writelines function of the open report file
+        report_data: Consolidated report data with at least one feature
     """
     timestamp = report_data["timestamp"]
     total_features = report_data["total_features"]
@@ -200,77 +389,86 @@ def generate_markdown_report(report_data: Dict[str, Any], output_file: str) -> N
     features = report_data["features"]
     persona_stats = report_data["persona_stats"]
 
-    # Start building the markdown
-    markdown = "# Feature Interview Analysis Report\n\n"
-    markdown += f"**Generated:** {timestamp}\n\n"
-    markdown += "## Executive Summary\n\n"
-    markdown += f"Total features analyzed: **{total_features}**\n\n"
-    markdown += "### Decision Summary\n\n"
-    markdown += f"- GO: {decision_summary['GO']} ({decision_summary['GO']/total_features*100:.1f}%)\n"
-    markdown += f"- NO-GO: {decision_summary['NO-GO']} ({decision_summary['NO-GO']/total_features*100:.1f}%)\n"
+    # One reciprocal for all the decision percentages
+    inv = 100.0 / total_features
+
+    w(f"**Generated:** {timestamp}\n\n")
+    w("## Executive Summary\n\n")
+    w(f"Total features analyzed: **{total_features}**\n\n")
+    w("### Decision Summary\n\n")
+    w(f"- GO: {decision_summary['GO']} ({decision_summary['GO'] * inv:.1f}%)\n")
+    w(
+        f"- NO-GO: {decision_summary['NO-GO']} ({decision_summary['NO-GO'] * inv:.1f}%)\n"
+    )
     if decision_summary["UNKNOWN"] > 0:
-        markdown += f"- UNKNOWN: {decision_summary['UNKNOWN']} ({decision_summary['UNKNOWN']/total_features*100:.1f}%)\n"
+        w(
+            f"- UNKNOWN: {decision_summary['UNKNOWN']} ({decision_summary['UNKNOWN'] * inv:.1f}%)\n"
+        )
 
-    markdown += "\n## Persona Sentiment Analysis\n\n"
+    w("\n## Persona Sentiment Analysis\n\n")
 
     # Add persona stats table
-    markdown += "| Persona | Positive | Neutral | Negative | Total |\n"
-    markdown += "|---------|----------|---------|----------|-------|\n"
+    w("| Persona | Positive | Neutral | Negative | Total |\n")
+    w("|---------|----------|---------|----------|-------|\n")
 
     for name, stats in persona_stats.items():
         total = (
             stats["POSITIVE"] + stats["NEUTRAL"] + stats["NEGATIVE"] + stats["UNKNOWN"]
         )
-        markdown += f"| {name} | {stats['POSITIVE']} | {stats['NEUTRAL']} | {stats['NEGATIVE']} | {total} |\n"
+        w(
+            f"| {name} | {stats['POSITIVE']} | {stats['NEUTRAL']} | {stats['NEGATIVE']} | {total} |\n"
+        )
 
     # Add feature summary table
-    markdown += "\n## Feature Decision Summary\n\n"
-    markdown += "| Feature | Decision | Market Perspective |\n"
-    markdown += "|---------|----------|-------------------|\n"
-
-    for feature in sorted(
-        features, key=lambda x: (0 if x["decision"] == "GO" else 1, x["topic"])
-    ):
-        # Truncate market perspective if too long
-        perspective = (
-            feature["market_perspective"][:150] + "..."
-            if len(feature["market_perspective"]) > 150
-            else feature["market_perspective"]
-        )
-        markdown += (
-            f"| {feature['topic']} | **{feature['decision']}** | {perspective} |\n"
+    w("\n## Feature Decision Summary\n\n")
+    w("| Feature | Decision | Market Perspective |\n")
+    w("|---------|----------|-------------------|\n")
+    writelines(
+        _summary_row(feature)
+        for feature in sorted(
+            features, key=lambda x: (0 if x["decision"] == "GO" else 1, x["topic"])
         )
+    )
 
     # Add detailed feature sections
-    markdown += "\n## Feature Details\n\n"
+    w("\n## Feature Details\n\n")
+    writelines(_feature_details(feature) for feature in features)
 
-    for feature in features:
-        markdown += f"### {feature['topic']}\n\n"
-        markdown += f"**Decision: {feature['decision']}**\n\n"
-        markdown += f"**Market Perspective:**\n{feature['market_perspective']}\n\n"
 
-        markdown += "**Key Rationale:**\n"
-        for point in feature["rationale"]:
-            markdown += f"- {point}\n"
+def generate_markdown_report(report_data: Dict[str, Any], output_file: str) -> None:
+    """
+    Generate a markdown report from consolidated report data
 
-        markdown += "\n**Persona Feedback:**\n\n"
-        for persona in feature["personas"]:
-            markdown += f"- **{persona['name']} ({persona['sentiment']})**: {persona['summary']}\n"
+    Args:
+        report_data: Consolidated report data
+        output_file: Path to save the markdown report
+    """
+    total_features = report_data.get("total_features", 0)
 
-        markdown += (
-            f"\n[Full Transcript]({os.path.basename(feature['transcript_path'])})\n\n"
-        )
-        markdown += "---\n\n"
+    # Stream each section to the file instead of holding the whole document
+    with open(output_file, "w", encoding="utf-8", buffering=1 << 20) as f:
+        w = f.write
+        w("# Feature Interview Analysis Report\n\n")
 
-    # Save to file
-    with open(output_file, "w", encoding="utf-8") as f:
-        f.write(markdown)
+        # Nothing to summarize (e.g. no transcripts were found)
+        if not total_features:
+            w(f"{report_data.get('error', 'No features to analyze.')}\n")
+        else:
+            _write_report_sections(w, f.writelines, report_data)
 
     logger.info(f"Saved markdown report to {output_file}")
 
 
-def main():
-    """Main entry point for the report generator"""
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Main entry point for the report generator
+
+    Args:
+        argv: Command-line arguments (default: sys.argv[1:])
+
+    Returns:
+        Process exit code
+    """
     import argparse
 
     parser = argparse.ArgumentParser(
@@ -288,8 +486,14 @@ def main():
     parser.add_argument(
         "--output-markdown", "-m", help="Path to save the markdown report", default=None
     )
+    parser.add_argument(
+        "--cache-dir",
+        help="Directory for the transcript parse cache "
+        "(default: the JSON report's directory)",
+        default=None,
+    )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Generate default filenames if not provided
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -298,9 +502,19 @@ def main():
     if args.output_markdown is None:
         args.output_markdown = f"consolidated_report_{timestamp}.md"
 
-    # Generate the reports
-    report_data = generate_consolidated_report(args.transcripts_dir, args.output_json)
-    generate_markdown_report(report_data, args.output_markdown)
+    # Generate the reports; the JSON file is written while the markdown is built
+    cache_dir = args.cache_dir or os.path.dirname(os.path.abspath(args.output_json))
+    report_data = generate_consolidated_report(
+        args.transcripts_dir, cache_dir=cache_dir
+    )
+    if "error" in report_data:
+        logger.error(report_data["error"])
+        return 1
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        json_future = executor.submit(save_report_json, report_data, args.output_json)
+        generate_markdown_report(report_data, args.output_markdown)
+        json_future.result()
 
     print("\nReport Generation Complete:")
     print(f"- JSON report: {args.output_json}")
@@ -309,6 +523,8 @@ def main():
     print(f"- GO decisions: {report_data['decision_summary']['GO']}")
     print(f"- NO-GO decisions: {report_data['decision_summary']['NO-GO']}")
 
+    return 0
+
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -1,19 +1,119 @@
 #!/usr/bin/env python3
 """
 Run all tests for the reviews-fetcher project.
+
+The project and app_review_analyzer import paths are set up here, or by
+tests/conftest.py under pytest; a test module run on its own as a script
+(python tests/test_x.py) needs them on PYTHONPATH.
 """
+import hashlib
+import json
 import unittest
 import sys
 from pathlib import Path
+from typing import Iterator, List, Optional
 
-# Add the project directory to path
+# Add the project directory and the app_review_analyzer package to path
+# (tests/conftest.py does the same under pytest)
 sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent / "app_review_analyzer"))
+
+SUITE_CACHE_NAME = ".suite_cache.json"
+
+
+def iter_all(suite: unittest.TestSuite) -> Iterator[unittest.TestCase]:
+    """
+    Flatten a (possibly nested) test suite into its test cases
+
+    Args:
+        suite: Suite returned by the test loader
+
+    Returns:
+        Iterator over the individual test cases
+    """
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            yield from iter_all(test)
+        else:
+            yield test
+
+
+def tests_signature(tests_dir: Path) -> str:
+    """
+    Build a signature of the test sources from their paths and mtimes
+
+    Args:
+        tests_dir: Directory containing the test modules
+
+    Returns:
+        Hex digest that changes whenever a test file is added, removed or edited
+    """
+    sig = hashlib.md5()
+    for path in sorted(tests_dir.rglob("*.py")):
+        sig.update(str(path).encode())
+        sig.update(str(path.stat().st_mtime_ns).encode())
+    return sig.hexdigest()
+
+
+def load_cached_ids(cache_path: Path, key: str) -> Optional[List[str]]:
+    """
+    Read the cached test IDs if they were recorded for the same signature
+
+    Args:
+        cache_path: Path to the suite cache file
+        key: Current signature of the test sources
+
+    Returns:
+        List of test IDs, or None if the cache is missing or stale
+    """
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if cache.get("key") != key:
+        return None
+    return cache.get("ids")
+
+
+def load_suite(tests_dir: Path) -> unittest.TestSuite:
+    """
+    Load the test suite, skipping directory discovery when nothing has changed
+
+    Args:
+        tests_dir: Directory containing the test modules
+
+    Returns:
+        Suite with all tests
+    """
+    test_loader = unittest.TestLoader()
+    cache_path = tests_dir / SUITE_CACHE_NAME
+    key = tests_signature(tests_dir)
+
+    ids = load_cached_ids(cache_path, key)
+    if ids:
+        # discover() puts the tests directory on the path; do the same here
+        sys.path.insert(0, str(tests_dir))
+        return test_loader.loadTestsFromNames(ids)
+
+    test_suite = test_loader.discover(str(tests_dir))
+
+    # Only cache a clean discovery, so import errors are reported again next run
+    if not test_loader.errors:
+        ids = [test.id() for test in iter_all(test_suite)]
+        try:
+            with open(cache_path, "w", encoding="utf-8") as f:
+                json.dump({"key": key, "ids": ids}, f)
+        except OSError:
+            pass
+
+    return test_suite
+
 
 if __name__ == "__main__":
     # Find all tests
-    test_loader = unittest.TestLoader()
     tests_dir = Path(__file__).parent / "tests"
-    test_suite = test_loader.discover(str(tests_dir))
+    test_suite = load_suite(tests_dir)
 
     # Run the tests
     test_runner = unittest.TextTestRunner(verbosity=2)
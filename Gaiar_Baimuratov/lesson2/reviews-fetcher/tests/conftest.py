@@ -0,0 +1,13 @@
+"""
+Shared pytest setup for the reviews-fetcher tests.
+"""
+
+import sys
+from pathlib import Path
+
+# Make the project scripts and the app_review_analyzer package importable once,
+# instead of patching sys.path in every test module
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+for path in (PROJECT_DIR, PROJECT_DIR / "app_review_analyzer"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
@@ -0,0 +1,84 @@
+"""
+Unit tests for the feature adapter.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+
+from feature_adapter import group_similar_features, iter_features
+
+
+class TestGroupSimilarFeatures(unittest.TestCase):
+    """Tests for group_similar_features."""
+
+    def setUp(self):
+        self.dark_mode = {
+            "topic": "Dark mode support",
+            "core_questions": [
+                "Would you use a dark mode when reading at night?",
+                "How important is a dark mode to you?",
+            ],
+        }
+        self.offline = {
+            "topic": "Offline reading",
+            "core_questions": ["Do you read articles without an internet connection?"],
+        }
+
+    def test_near_duplicates_are_grouped(self):
+        near_duplicate = {
+            "topic": "Dark mode support",
+            "core_questions": self.dark_mode["core_questions"]
+            + ["Which theme do you prefer?"],
+        }
+
+        grouped = group_similar_features([self.dark_mode, self.offline, near_duplicate])
+
+        # The representative is the variant with the most core questions
+        self.assertEqual(grouped, [near_duplicate, self.offline])
+
+    def test_distinct_features_are_kept(self):
+        grouped = group_similar_features([self.dark_mode, self.offline])
+
+        self.assertEqual(grouped, [self.dark_mode, self.offline])
+
+    def test_exact_duplicates_are_removed(self):
+        duplicate = dict(self.dark_mode)
+
+        grouped = group_similar_features([self.dark_mode, duplicate, self.offline])
+
+        self.assertEqual(len(grouped), 2)
+        self.assertIs(grouped[0], self.dark_mode)
+        self.assertIs(grouped[1], self.offline)
+
+    def test_empty_list(self):
+        self.assertEqual(group_similar_features([]), [])
+
+
+class TestIterFeatures(unittest.TestCase):
+    """Tests for iter_features."""
+
+    def write_features_file(self, content):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        path = os.path.join(temp_dir.name, "features.json")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+        return path
+
+    def test_leading_whitespace_before_array(self):
+        feature = {"topic": "Dark mode", "core_questions": ["Would you use it?"]}
+        path = self.write_features_file(" \n\t" * 40 + json.dumps([feature]))
+
+        self.assertEqual(list(iter_features(path)), [feature])
+
+    def test_non_array_document_is_rejected(self):
+        path = self.write_features_file("  " + json.dumps({"topic": "Dark mode"}))
+
+        with self.assertRaises(ValueError):
+            list(iter_features(path))
+
+
+if __name__ == "__main__":
+    unittest.main()
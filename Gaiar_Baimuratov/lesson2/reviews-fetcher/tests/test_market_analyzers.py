@@ -3,7 +3,6 @@ Unit tests for all-market analysis scripts.
 """
 
 import os
-import sys
 import json
 import unittest
 from unittest.mock import patch, MagicMock, call
@@ -11,21 +10,19 @@ from pathlib import Path
 import tempfile
 from datetime import datetime, timedelta
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 # Import the scripts to test
-from pull_all_markets import get_all_countries, pull_all_markets_reviews
-from analyze_all_markets import analyze_reviews_file
+from pull_all_markets import (
+    get_all_countries,
+    pull_all_markets_reviews,
+    _write_reviews_json,
+)
+from analyze_all_markets import analyze_reviews_file, load_country_files
 
 
 class TestPullAllMarkets(unittest.TestCase):
     """Tests for pull_all_markets.py script."""
 
     def setUp(self):
-        # Create temp dir for output
-        self.temp_dir = tempfile.TemporaryDirectory()
-
         # Mock client
         self.mock_client = MagicMock()
 
@@ -93,9 +90,6 @@ class TestPullAllMarkets(unittest.TestCase):
             "total_pages": 2,
         }
 
-    def tearDown(self):
-        self.temp_dir.cleanup()
-
     def test_get_all_countries(self):
         """Test getting all countries."""
         self.mock_client.get_countries.return_value = self.mock_countries
@@ -116,9 +110,7 @@ class TestPullAllMarkets(unittest.TestCase):
         # Monkeypatch Path.mkdir to do nothing
         with patch("pathlib.Path.mkdir"), patch(
             "pull_all_markets.AppBotClient", return_value=self.mock_client
-        ), patch("pull_all_markets.open", unittest.mock.mock_open()), patch(
-            "json.dump"
-        ):
+        ), patch("pull_all_markets._write_reviews_json"):
 
             # Run the function with a mock app_id
             result_file = pull_all_markets_reviews("test_app_id", days=30)
@@ -164,9 +156,7 @@ class TestPullAllMarkets(unittest.TestCase):
         # Monkeypatch Path.mkdir to do nothing
         with patch("pathlib.Path.mkdir"), patch(
             "pull_all_markets.AppBotClient", return_value=self.mock_client
-        ), patch("pull_all_markets.open", unittest.mock.mock_open()), patch(
-            "json.dump"
-        ):
+        ), patch("pull_all_markets._write_reviews_json"):
 
             # Run the function
             pull_all_markets_reviews("test_app_id", days=7)
@@ -204,9 +194,7 @@ class TestPullAllMarkets(unittest.TestCase):
 
         with patch("pathlib.Path.mkdir"), patch(
             "pull_all_markets.AppBotClient", return_value=self.mock_client
-        ), patch("pull_all_markets.open", unittest.mock.mock_open()), patch(
-            "json.dump"
-        ):
+        ), patch("pull_all_markets._write_reviews_json"):
 
             # Run with 90 days
             pull_all_markets_reviews("test_app_id", days=90)
@@ -232,9 +220,7 @@ class TestPullAllMarkets(unittest.TestCase):
         # Monkeypatch Path.mkdir to do nothing
         with patch("pathlib.Path.mkdir"), patch(
             "pull_all_markets.AppBotClient", return_value=self.mock_client
-        ), patch("pull_all_markets.open", unittest.mock.mock_open()), patch(
-            "json.dump"
-        ):
+        ), patch("pull_all_markets._write_reviews_json"):
 
             # Run the function - should not crash
             result = pull_all_markets_reviews("test_app_id", days=30)
@@ -248,16 +234,34 @@ class TestPullAllMarkets(unittest.TestCase):
             # Return value should be valid
             self.assertIsNotNone(result)
 
+    def test_write_reviews_json_round_trip(self):
+        """Test that review files written line-per-review load back as JSON."""
+        payload = {
+            "app_id": "test_app_id",
+            "rating_stats": {1: 0, 5: 2},
+            "total_count": 2,
+            "results": self.mock_reviews_response["results"],
+        }
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_file = Path(temp_dir) / "reviews.json"
+
+            _write_reviews_json(output_file, payload)
+
+            with open(output_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+
+        self.assertEqual(data["results"], payload["results"])
+        self.assertEqual(data["rating_stats"], {"1": 0, "5": 2})
+        self.assertEqual(data["total_count"], 2)
+
 
 class TestAnalyzeAllMarkets(unittest.TestCase):
     """Tests for analyze_all_markets.py script."""
 
-    def setUp(self):
-        # Create temp dir for output
-        self.temp_dir = tempfile.TemporaryDirectory()
-
-        # Create a mock reviews file with multi-country and multi-language data
-        self.mock_reviews_data = {
+    @classmethod
+    def setUpClass(cls):
+        # Mock reviews with multi-country and multi-language data
+        cls.mock_reviews_data = {
             "app_id": "test_app_id",
             "start_date": "2023-01-01",
             "end_date": "2023-12-31",
@@ -320,13 +324,12 @@ class TestAnalyzeAllMarkets(unittest.TestCase):
                 },
             ],
         }
+        # Serialized once and shared by every test's mock_open
+        cls.mock_reviews_json = json.dumps(cls.mock_reviews_data)
 
-        self.mock_file_path = os.path.join(self.temp_dir.name, "mock_reviews.json")
-        with open(self.mock_file_path, "w") as f:
-            json.dump(self.mock_reviews_data, f)
-
-    def tearDown(self):
-        self.temp_dir.cleanup()
+        # Path.mkdir and open are patched wherever these paths are used
+        cls.temp_dir_name = "/tmp/fake_test_dir"
+        cls.mock_file_path = "/tmp/fake_test_dir/mock_reviews.json"
 
     @patch("analyze_all_markets.chunk_reviews")
     @patch("analyze_all_markets.extract_features_from_chunk")
@@ -379,13 +382,13 @@ class TestAnalyzeAllMarkets(unittest.TestCase):
         # Mock file operations
         with patch("pathlib.Path.mkdir"), patch(
             "analyze_all_markets.open",
-            unittest.mock.mock_open(read_data=json.dumps(self.mock_reviews_data)),
+            unittest.mock.mock_open(read_data=self.mock_reviews_json),
         ), patch("json.dump") as mock_json_dump, patch(
             "json.load", return_value=self.mock_reviews_data
         ):
 
             # Run the function
-            result_file = analyze_reviews_file(self.mock_file_path, self.temp_dir.name)
+            result_file = analyze_reviews_file(self.mock_file_path, self.temp_dir_name)
 
             # Verify functions were called correctly
             mock_chunk.assert_called_once()
@@ -420,12 +423,12 @@ class TestAnalyzeAllMarkets(unittest.TestCase):
         # Set up mocks
         mock_analyze.return_value = "mock_output.json"
         mock_argument.return_value = self.mock_file_path
-        mock_option.return_value = self.temp_dir.name
+        mock_option.return_value = self.temp_dir_name
 
         # Call main directly - it's using typer which makes sys.argv mocking difficult
         from analyze_all_markets import main
 
-        result = main(file_path=self.mock_file_path, output_dir=self.temp_dir.name)
+        result = main(file_path=self.mock_file_path, output_dir=self.temp_dir_name)
 
         # Verify analyze_reviews_file was called (not checking exact args due to typer decorators)
         self.assertTrue(mock_analyze.called)
@@ -439,7 +442,7 @@ class TestAnalyzeAllMarkets(unittest.TestCase):
             "analyze_all_markets.chunk_reviews", side_effect=Exception("Test error")
         ), patch(
             "analyze_all_markets.open",
-            unittest.mock.mock_open(read_data=json.dumps(self.mock_reviews_data)),
+            unittest.mock.mock_open(read_data=self.mock_reviews_json),
         ), patch(
             "pathlib.Path.mkdir"
         ), patch(
@@ -447,11 +450,25 @@ class TestAnalyzeAllMarkets(unittest.TestCase):
         ):
 
             # Run the function - should not crash
-            result = analyze_reviews_file(self.mock_file_path, self.temp_dir.name)
+            result = analyze_reviews_file(self.mock_file_path, self.temp_dir_name)
 
             # Result should be None due to the exception
             self.assertIsNone(result)
 
+    def test_load_country_files(self):
+        """Test loading reviews from the per-country files of a manifest."""
+        results = self.mock_reviews_data["results"]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for name, reviews in (("us.json", results[:3]), ("de.json", results[3:])):
+                with open(os.path.join(temp_dir, name), "w") as f:
+                    json.dump({"results": reviews}, f)
+
+            reviews = load_country_files(
+                os.path.join(temp_dir, "manifest.json"), ["us.json", "de.json"]
+            )
+
+        self.assertEqual(reviews, results)
+
 
 if __name__ == "__main__":
     unittest.main()
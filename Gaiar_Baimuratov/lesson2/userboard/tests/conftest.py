@@ -0,0 +1,29 @@
+"""Shared fixtures for the userboard tests."""
+
+import sys
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+script_path = ROOT / "userboard4-baimuratov.py"
+
+
+@pytest.fixture(scope="session")
+def interview():
+    """Load userboard4-baimuratov.py once per session (and per xdist worker)."""
+    if "interview" in sys.modules:
+        return sys.modules["interview"]
+
+    # Dynamically load the target module from its file path
+    spec = importlib.util.spec_from_file_location("interview", script_path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["interview"] = module
+    try:
+        spec.loader.exec_module(module)
+    except Exception:
+        del sys.modules["interview"]
+        raise
+    return module
@@ -2,19 +2,12 @@
 
 import csv
 import json
-import importlib.util
 from pathlib import Path
 
-# Dynamically load the target module from its file path
-ROOT = Path(__file__).resolve().parent.parent
-script_path = ROOT / "userboard4-baimuratov.py"
+import pytest
 
-spec = importlib.util.spec_from_file_location("interview", script_path)
-interview = importlib.util.module_from_spec(spec)  # type: ignore
-spec.loader.exec_module(interview)  # type: ignore
 
-
-def test_build_description():
+def test_build_description(interview):
     row = {
         "age": "30",
         "role": "Product manager",
@@ -29,8 +22,32 @@ def test_build_description():
     assert "Works remotely" in desc
 
 
-def test_load_personas_from_csv(tmp_path: Path):
-    csv_path = tmp_path / "personas.csv"
+LEGACY_CONFIG = {
+    "topic": "New SaaS platform for task automation",
+    "core_questions": [
+        "What problems do you face with current tools?",
+        "How do you measure success?",
+    ],
+    "max_followups": 2,
+}
+
+BATCH_CONFIG = {
+    "features": [
+        {"topic": "Feature 1", "core_questions": ["Q1", "Q2"]},
+        {"topic": "Feature 2", "core_questions": ["Q3", "Q4"]},
+    ],
+    "max_followups": 3,
+}
+
+
+@pytest.fixture(scope="session")
+def data_dir(tmp_path_factory) -> Path:
+    return tmp_path_factory.mktemp("data", numbered=False)
+
+
+@pytest.fixture(scope="session")
+def personas_csv(data_dir: Path) -> Path:
+    csv_path = data_dir / "personas.csv"
 
     with open(csv_path, "w", newline="", encoding="utf-8") as f:
         writer = csv.writer(f)
@@ -61,7 +78,25 @@ def test_load_personas_from_csv(tmp_path: Path):
             ]
         )
 
-    personas = interview.load_personas_from_csv(str(csv_path))
+    return csv_path
+
+
+@pytest.fixture(scope="session")
+def legacy_config_path(data_dir: Path) -> Path:
+    config_path = data_dir / "config.json"
+    config_path.write_text(json.dumps(LEGACY_CONFIG), encoding="utf-8")
+    return config_path
+
+
+@pytest.fixture(scope="session")
+def batch_config_path(data_dir: Path) -> Path:
+    config_path = data_dir / "batch_config.json"
+    config_path.write_text(json.dumps(BATCH_CONFIG), encoding="utf-8")
+    return config_path
+
+
+def test_load_personas_from_csv(interview, personas_csv: Path):
+    personas = interview.load_personas_from_csv(str(personas_csv))
     assert len(personas) == 1
     persona = personas[0]
     assert persona["name"] == "Dana (Designer)"
@@ -70,38 +105,60 @@ def test_load_personas_from_csv(tmp_path: Path):
     assert persona["emoji"] == "🎨"
 
 
-def test_load_interview_config(tmp_path: Path):
+def test_load_interview_config(
+    interview, legacy_config_path: Path, batch_config_path: Path
+):
     # Test legacy format
-    config_path = tmp_path / "config.json"
-    legacy_data = {
-        "topic": "New SaaS platform for task automation",
-        "core_questions": [
-            "What problems do you face with current tools?",
-            "How do you measure success?",
-        ],
-        "max_followups": 2,
-    }
-    config_path.write_text(json.dumps(legacy_data), encoding="utf-8")
-
-    cfg = interview.load_interview_config(str(config_path))
-    assert cfg["topic"] == legacy_data["topic"]
-    assert cfg["core_questions"] == legacy_data["core_questions"]
+    cfg = interview.load_interview_config(str(legacy_config_path))
+    assert cfg["topic"] == LEGACY_CONFIG["topic"]
+    assert cfg["core_questions"] == LEGACY_CONFIG["core_questions"]
     assert cfg["max_followups"] == 2
 
     # Test batch format
-    batch_config_path = tmp_path / "batch_config.json"
-    batch_data = {
-        "features": [
-            {"topic": "Feature 1", "core_questions": ["Q1", "Q2"]},
-            {"topic": "Feature 2", "core_questions": ["Q3", "Q4"]},
-        ],
-        "max_followups": 3,
-    }
-    batch_config_path.write_text(json.dumps(batch_data), encoding="utf-8")
-
     batch_cfg = interview.load_interview_config(str(batch_config_path))
     assert "features" in batch_cfg
     assert len(batch_cfg["features"]) == 2
     assert batch_cfg["features"][0]["topic"] == "Feature 1"
     assert batch_cfg["features"][1]["core_questions"] == ["Q3", "Q4"]
     assert batch_cfg["max_followups"] == 3
+
+
+def test_facilitator_prompt_keeps_tail_within_token_budget(interview, monkeypatch):
+    monkeypatch.setattr(interview, "_count_tokens", lambda text: len(text.split()))
+    transcript = [
+        {"role": "user", "content": "Old question?"},
+        {"role": "assistant", "name": "Alice", "content": "one two three four"},
+        {"role": "user", "content": "New question?"},
+        {"role": "assistant", "name": "Bob", "content": "five six seven"},
+    ]
+
+    prompt = interview.transcript_to_facilitator_prompt(
+        "Topic", transcript, ["Q?"], [], max_tokens=5
+    )
+    user_content = prompt[1]["content"]
+
+    assert "Facilitator: New question?" in user_content
+    assert "Bob: five six seven" in user_content
+    assert "Alice" not in user_content
+    assert "Old question?" not in user_content
+
+    # The latest message is kept even when it alone exceeds the budget
+    prompt = interview.transcript_to_facilitator_prompt(
+        "Topic", transcript, ["Q?"], [], max_tokens=1
+    )
+    assert "Bob: five six seven" in prompt[1]["content"]
+    assert "New question?" not in prompt[1]["content"]
+
+
+def test_count_tokens_estimates_when_encoding_is_unavailable(interview, monkeypatch):
+    def unavailable(name):
+        raise OSError("no network")
+
+    monkeypatch.setattr(interview.tiktoken, "get_encoding", unavailable)
+    interview._token_encoding.cache_clear()
+    interview._count_tokens.cache_clear()
+    try:
+        assert interview._count_tokens("x" * 40) == 11
+    finally:
+        interview._token_encoding.cache_clear()
+        interview._count_tokens.cache_clear()
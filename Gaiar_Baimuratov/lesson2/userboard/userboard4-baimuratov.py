@@ -4,19 +4,26 @@ import os
 import json
 import sys
 import re
+from contextlib import contextmanager, nullcontext
 from datetime import datetime
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 from pydantic import BaseModel
+import tiktoken
 from agents import Agent, Runner, trace
-from dotenv import load_dotenv
-from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
-from rich import box
-from rich.table import Table
-from rich.markdown import Markdown
+from openai.types.responses import ResponseTextDeltaEvent
 import csv
 
+try:
+    from rich.console import Console, Group
+    from rich.live import Live
+    from rich.panel import Panel
+    from rich.text import Text
+    from rich import box
+    from rich.table import Table
+except ImportError:
+    sys.exit("rich is required: pip install -r requirements.txt")
+
 # ---------- persona utilities ---------- #
 
 
@@ -173,6 +180,12 @@ def load_interview_config(path: str) -> Dict[str, Any]:
 # Create rich console
 console = Console()
 
+# Upper bound on persona agent calls in flight at once (OpenAI rate limits)
+PERSONA_CONCURRENCY = 8
+
+# Token budget for the transcript tail shown to the facilitator each turn
+FACILITATOR_CONTEXT_TOKENS = 1500
+
 
 # ---------- summary schema ---------- #
 class SummaryReport(BaseModel):
@@ -194,6 +207,12 @@ class SentimentAnalysis(BaseModel):
     personas: List[PersonaSentiment]
 
 
+# Facilitator decision for one turn
+class FacOut(BaseModel):
+    next_question: str
+    should_end: bool
+
+
 # ---------- agent factories ---------- #
 def make_persona_agent(
     name: str,
@@ -263,10 +282,6 @@ You are the *facilitator*.
 {{"next_question": "<string>", "should_end": true|false}}
 """
 
-    class FacOut(BaseModel):
-        next_question: str
-        should_end: bool
-
     return Agent(
         name="Facilitator",
         instructions=instr,
@@ -276,7 +291,7 @@ You are the *facilitator*.
     )
 
 
-def make_summarizer_agent() -> Agent:
+def make_summarizer_agent(model: Optional[str] = None) -> Agent:
     instr = """
 You are a senior product strategist.  
 Given the full transcript of a multi‑persona interview:
@@ -291,8 +306,9 @@ Return **exactly** a JSON object matching the SummaryReport schema.
         name="Summarizer",
         instructions=instr,
         output_type=SummaryReport,
-        # don't change the model
-        model="o3",  # latest reasoning model
+        # don't change the default model (o3, latest reasoning model);
+        # SUMMARIZER_MODEL overrides it per run
+        model=model or os.getenv("SUMMARIZER_MODEL", "o3"),
     )
 
 
@@ -330,9 +346,40 @@ Return a JSON structured as:
     )
 
 
+@lru_cache(maxsize=1)
+def _token_encoding():
+    """Return o4-mini's ``o200k_base`` encoding, or None if it cannot be loaded.
+
+    tiktoken downloads the BPE file on first use, so a network failure here
+    falls back to an estimate instead of aborting an interview mid-way.
+    """
+    try:
+        return tiktoken.get_encoding("o200k_base")
+    except (OSError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=1024)
+def _count_tokens(text: str) -> int:
+    """Return the number of o4-mini tokens in ``text``.
+
+    Estimated as one token per four characters when the encoding is not
+    available. Cached because the same transcript messages are counted again
+    on every facilitator turn.
+    """
+    encoding = _token_encoding()
+    if encoding is None:
+        return len(text) // 4 + 1
+    return len(encoding.encode(text))
+
+
 # Helper function to convert transcript to a string message for facilitator
 def transcript_to_facilitator_prompt(
-    topic: str, transcript, core_questions, asked_questions
+    topic: str,
+    transcript,
+    core_questions,
+    asked_questions,
+    max_tokens: int = FACILITATOR_CONTEXT_TOKENS,
 ):
     """Create a prompt for the facilitator agent.
 
@@ -342,20 +389,38 @@ def transcript_to_facilitator_prompt(
 
     The function now takes the current ``topic`` string explicitly so the
     prompt always aligns with the configured interview topic.
+
+    The system message only holds what stays the same for the whole interview
+    (topic and core questions), so it forms an identical prefix on every turn
+    that OpenAI's prompt caching can reuse. Everything that changes per turn
+    goes into the user message.
+
+    Only the most recent messages that fit in ``max_tokens`` are included;
+    the latest message is always kept.
     """
 
-    prompt = f"""You are facilitating an interview about the following idea:
+    system_prompt = f"""You are a facilitator conducting an interview.
+
+You are facilitating an interview about the following idea:
 {topic}
 
-Questions to ask:
-- Core questions: {core_questions}
-- Already asked: {asked_questions}
+Core questions: {core_questions}"""
 
-Recent conversation:
-"""
+    parts = [f"""Already asked: {asked_questions}
 
-    # Add the most recent exchanges (most recent 5-10 exchanges)
-    recent_msgs = transcript[-20:] if len(transcript) > 20 else transcript
+Recent conversation:
+"""]
+
+    # Add the most recent exchanges that fit in the token budget
+    start = len(transcript)
+    budget = max_tokens
+    while start > 0:
+        tokens = _count_tokens(transcript[start - 1].get("content", ""))
+        if tokens > budget and start < len(transcript):
+            break
+        budget -= tokens
+        start -= 1
+    recent_msgs = transcript[start:]
 
     for msg in recent_msgs:
         role = msg.get("role", "")
@@ -363,18 +428,18 @@ Recent conversation:
         content = msg.get("content", "")
 
         if role == "user":
-            prompt += f"\nFacilitator: {content}\n"
+            parts.append(f"\nFacilitator: {content}\n")
         elif role == "assistant":
             if name:
-                prompt += f"{name}: {content}\n"
+                parts.append(f"{name}: {content}\n")
             else:
-                prompt += f"Assistant: {content}\n"
+                parts.append(f"Assistant: {content}\n")
 
-    prompt += "\nDecide on the next question to ask or if the interview should end."
+    parts.append("\nDecide on the next question to ask or if the interview should end.")
 
     return [
-        {"role": "system", "content": "You are a facilitator conducting an interview."},
-        {"role": "user", "content": prompt},
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": "".join(parts)},
     ]
 
 
@@ -382,7 +447,7 @@ def transcript_to_persona_prompt(
     persona_name: str,
     persona_description: str,
     current_question: str,
-    transcript,
+    responses_by_question: Dict[str, List[Tuple[str, str]]],
     *,
     topic: str,
 ):
@@ -394,7 +459,7 @@ def transcript_to_persona_prompt(
     3. The current question being asked
     4. Other personas' responses to the same question (if any)
 
-    The function extracts relevant responses from the interview transcript, filters out
+    The function looks up the responses to the current question, filters out
     the persona's own previous responses, and formats everything into a chat message list
     suitable for sending to an LLM agent. The resulting prompt instructs the persona
     to consider other participants' responses when formulating their answer.
@@ -407,8 +472,9 @@ def transcript_to_persona_prompt(
         A description of the persona's characteristics and background
     current_question : str
         The question currently being asked in the interview
-    transcript : list
-        The full interview transcript so far
+    responses_by_question : dict
+        Maps each asked question to the ``(name, response)`` pairs given to it
+        so far, in answer order; kept up to date by ``run_interview``
     topic : str
         The overall topic/product idea being discussed in the interview
 
@@ -418,52 +484,39 @@ def transcript_to_persona_prompt(
         A list of message dictionaries formatted for LLM chat completion
     """
 
-    prompt = (
+    # Persona identity and topic never change during an interview; keep them in
+    # the system message so every turn shares the same cacheable prefix
+    system_prompt = (
+        "You are in a group interview.\n\n"
         f"You are {persona_name}.\n"
         f"Persona details: {persona_description}\n\n"
-        f"Interview topic: {topic}\n\n"
-        f"Current question: {current_question}\n\n"
+        f"Interview topic: {topic}"
     )
 
-    # Find responses to the current question
-    responses_for_current_question = []
-    collecting_current_responses = False
+    parts = [f"Current question: {current_question}\n\n"]
 
-    for msg in transcript:
-        if msg.get("role") == "user" and msg.get("content") == current_question:
-            collecting_current_responses = True
-            continue
-
-        if (
-            collecting_current_responses
-            and msg.get("role") == "assistant"
-            and "name" in msg
-        ):
-            if msg.get("name") != persona_name:  # Don't include own response
-                name = msg.get("name", "Unknown")
-                content = msg.get("content", "")
-                responses_for_current_question.append(f"{name}: {content}")
-
-        # If we encounter a new question, stop collecting
-        if (
-            collecting_current_responses
-            and msg.get("role") == "user"
-            and msg.get("content") != current_question
-        ):
-            break
+    # Responses to the current question, without the persona's own
+    responses_for_current_question = [
+        f"{name}: {content}"
+        for name, content in responses_by_question.get(current_question, [])
+        if name != persona_name
+    ]
 
     # Add responses to the prompt if any exist
     if responses_for_current_question:
-        prompt += "Other participants have already responded to this question:\n\n"
-        for response in responses_for_current_question:
-            prompt += f"{response}\n\n"
-        prompt += "Please provide your answer, and feel free to react to what others have said after giving your own perspective.\n"
+        parts.append("Other participants have already responded to this question:\n\n")
+        parts.extend(f"{response}\n\n" for response in responses_for_current_question)
+        parts.append(
+            "Please provide your answer, and feel free to react to what others have said after giving your own perspective.\n"
+        )
     else:
-        prompt += "You are the first to answer this question. Please provide your perspective.\n"
+        parts.append(
+            "You are the first to answer this question. Please provide your perspective.\n"
+        )
 
     return [
-        {"role": "system", "content": "You are in a group interview."},
-        {"role": "user", "content": prompt},
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": "".join(parts)},
     ]
 
 
@@ -476,7 +529,7 @@ def transcript_to_string_message(topic: str, transcript):
     hard‑coded *smart water bottle*.
     """
 
-    transcript_text = "Interview Transcript:\n\n"
+    parts = ["Interview Transcript:\n\n"]
 
     for msg in transcript:
         role = msg.get("role", "unknown")
@@ -484,12 +537,12 @@ def transcript_to_string_message(topic: str, transcript):
         content = msg.get("content", "")
 
         if role == "user":
-            transcript_text += f"Facilitator: {content}\n\n"
+            parts.append(f"Facilitator: {content}\n\n")
         elif role == "assistant":
             if name:
-                transcript_text += f"{name}: {content}\n\n"
+                parts.append(f"{name}: {content}\n\n")
             else:
-                transcript_text += f"Assistant: {content}\n\n"
+                parts.append(f"Assistant: {content}\n\n")
 
     # Return a single message with the entire transcript as content
     return [
@@ -497,7 +550,7 @@ def transcript_to_string_message(topic: str, transcript):
             "role": "system",
             "content": f"Analyze this interview transcript about: {topic}",
         },
-        {"role": "user", "content": transcript_text},
+        {"role": "user", "content": "".join(parts)},
     ]
 
 
@@ -524,22 +577,33 @@ def create_sentiment_prompt(transcript, personas):
             )
 
     # Create a prompt with each persona's responses
-    prompt = (
+    parts = [
         "Analyze the sentiment and key points from each persona in this interview:\n\n"
-    )
+    ]
 
     for name, responses in persona_responses.items():
-        prompt += f"## {name}\n"
+        parts.append(f"## {name}\n")
         for resp in responses:
-            prompt += f"Question: {resp['question']}\n"
-            prompt += f"Response: {resp['response']}\n\n"
+            parts.append(f"Question: {resp['question']}\n")
+            parts.append(f"Response: {resp['response']}\n\n")
 
     return [
         {"role": "system", "content": "You are a sentiment analysis expert."},
-        {"role": "user", "content": prompt},
+        {"role": "user", "content": "".join(parts)},
     ]
 
 
+@lru_cache(maxsize=None)
+def _mention_pattern(names: Tuple[str, ...]) -> "re.Pattern[str]":
+    """Return one case-insensitive regex matching any of ``names``.
+
+    Longer names are tried first so a name is never split by a shorter one
+    it contains. Cached, so each combination of names is compiled only once.
+    """
+    alternation = "|".join(map(re.escape, sorted(names, key=len, reverse=True)))
+    return re.compile(f"({alternation})", re.IGNORECASE)
+
+
 # Function to print colored persona responses
 def print_persona_response(
     persona_name: str,
@@ -560,36 +624,69 @@ def print_persona_response(
         for fallback styling.
     """
 
-    # Resolve this persona's style or fall back
-    style = styles.get(
-        persona_name, styles.get("default", {"color": "white", "emoji": "💬"})
-    )
-
-    # Highlight any mentions of other personas
+    # Highlight any mentions of other personas in a single pass
     highlighted_text = response
-    for other_name in [n for n in styles.keys() if n not in {persona_name, "default"}]:
+    mentioned = tuple(
+        n
+        for n in styles.keys()
+        if n not in {persona_name, "default"} and n in highlighted_text
+    )
+    if mentioned:
+        highlighted_text = _mention_pattern(mentioned).sub(
+            r"[bold]\1[/bold]", highlighted_text
+        )
 
-        if other_name in highlighted_text:
-            pattern = re.compile(f"({re.escape(other_name)})", re.IGNORECASE)
-            highlighted_text = pattern.sub(r"[bold]\1[/bold]", highlighted_text)
+    console.print(_persona_panel(persona_name, Text(highlighted_text), styles))
 
-    # Create panel with styled text
-    panel_title = f"{style['emoji']} {persona_name}"
 
-    # Format the response
-    formatted_text = Text(highlighted_text)
+def _persona_panel(
+    persona_name: str, body: Text, styles: Dict[str, Dict[str, str]]
+) -> Panel:
+    """Wrap ``body`` in the panel used for ``persona_name``'s responses."""
+    # Resolve this persona's style or fall back
+    style = styles.get(
+        persona_name, styles.get("default", {"color": "white", "emoji": "💬"})
+    )
 
-    # Create and display panel
-    panel = Panel(
-        formatted_text,
-        title=panel_title,
+    return Panel(
+        body,
+        title=f"{style['emoji']} {persona_name}",
         border_style=style["color"],
         box=box.ROUNDED,
         expand=False,
         padding=(1, 2),
     )
 
-    console.print(panel)
+
+@contextmanager
+def live_persona_panels(persona_names: List[str], styles: Dict[str, Dict[str, str]]):
+    """Show one live panel per persona while their responses stream in.
+
+    Yields ``{name: Text}``; whatever is appended to a persona's ``Text`` shows
+    up in their panel. The panels are cleared on exit so the finished responses
+    can be printed with ``print_persona_response``.
+    """
+    texts = {name: Text() for name in persona_names}
+    panels = Group(
+        *(_persona_panel(name, text, styles) for name, text in texts.items())
+    )
+    with Live(panels, console=console, refresh_per_second=10, transient=True):
+        yield texts
+
+
+async def run_streamed_into(agent: Agent, prompt, text: Text):
+    """Run ``agent`` on ``prompt``, appending its output to ``text`` as it arrives.
+
+    Returns the finished run, whose ``final_output`` is the same as
+    ``Runner.run`` would give.
+    """
+    result = Runner.run_streamed(agent, prompt)
+    async for event in result.stream_events():
+        if event.type == "raw_response_event" and isinstance(
+            event.data, ResponseTextDeltaEvent
+        ):
+            text.append(event.data.delta)
+    return result
 
 
 # Function to print facilitator questions
@@ -694,13 +791,29 @@ def save_transcript_to_file(markdown_content: str, topic: str) -> str:
 def print_executive_summary(report, sentiment_analysis, transcript_file=None):
     """Print executive summary with rich formatting.
 
+    The report is rendered into memory first and written to the terminal in a
+    single write instead of one write per panel and table.
+
     Args:
         report: SummaryReport object with market perspective, decision, and rationale
         sentiment_analysis: SentimentAnalysis object with persona sentiments
         transcript_file: Optional path to saved transcript file
     """
-    # Clear screen
-    console.clear()
+    # Clear screen (only on a real terminal; in logs it's just noise)
+    if console.is_terminal:
+        console.clear()
+
+    with console.capture() as capture:
+        _render_executive_summary(report, sentiment_analysis, transcript_file)
+    console.file.write(capture.get())
+    console.file.flush()
+
+
+def _render_executive_summary(report, sentiment_analysis, transcript_file=None):
+    """Print the panels and tables of the executive summary to ``console``."""
+    # Imported here: rich.markdown pulls in markdown-it and pygments, which
+    # only the final summary needs
+    from rich.markdown import Markdown
 
     # Title
     console.print(
@@ -812,6 +925,9 @@ async def run_interview(
     personas: List[Dict[str, str]],
     core_questions: List[str],
     max_followups: int = 2,
+    concurrent_personas: bool = False,
+    scripted_core_questions: bool = True,
+    stream_responses: bool = True,
 ) -> Dict[str, Any]:
     """Run a complete interview with personas and summarize results.
 
@@ -820,6 +936,16 @@ async def run_interview(
         personas: List of persona dictionaries with name and description
         core_questions: List of main questions to ask
         max_followups: Maximum number of follow-up questions
+        concurrent_personas: Ask all personas each question at once. Faster,
+            but no persona sees the others' answers to the same question, so
+            they cannot react to each other. By default personas answer one
+            after another.
+        scripted_core_questions: Ask the core questions in order without
+            consulting the facilitator, which only picks follow-ups and
+            decides when to end. Set to False to let the facilitator choose
+            every question.
+        stream_responses: Show persona answers in live panels while they are
+            generated instead of only once each answer is complete.
 
     Returns:
         Dictionary containing results:
@@ -926,32 +1052,70 @@ async def run_interview(
     console.print(persona_table)
     console.print("\n")
 
+    persona_semaphore = asyncio.Semaphore(PERSONA_CONCURRENCY)
+
+    # Persona responses indexed by question, so prompts don't rescan the transcript
+    responses_by_question: Dict[str, List[Tuple[str, str]]] = {}
+
+    def persona_live_view(persona_names):
+        if not stream_responses:
+            return nullcontext({})
+        return live_persona_panels(persona_names, persona_styles)
+
     async def ask_persona(
-        agent, persona_name, persona_description, current_question, transcript_so_far
+        agent, persona_name, persona_description, current_question, live_text=None
     ):
         # Convert to string-based prompt
         prompt = transcript_to_persona_prompt(
             persona_name,
             persona_description,
             current_question,
-            transcript_so_far,
+            responses_by_question,
             topic=topic,
         )
-        return await Runner.run(agent, prompt)
+        async with persona_semaphore:
+            if live_text is None:
+                return await Runner.run(agent, prompt)
+            return await run_streamed_into(agent, prompt, live_text)
+
+    def record_persona_response(current_question, persona_name, run):
+        # Record response
+        response = {
+            "role": "assistant",
+            "content": run.final_output,
+            "name": persona_name,
+        }
+        transcript.append(response)
+        responses_by_question[current_question].append((persona_name, run.final_output))
+
+        # Print colored response
+        print_persona_response(persona_name, run.final_output, persona_styles)
 
     with trace("Interview run"):
         console.print("[bold]Starting Interview...[/bold]")
         console.print("[dim]" + "―" * 80 + "[/dim]")
 
         while True:
-            # Convert transcript to string-based prompt for facilitator
-            fac_prompt = transcript_to_facilitator_prompt(
-                topic, transcript, core_questions, asked_questions
-            )
+            next_core = len(asked_questions)
+            if (
+                scripted_core_questions
+                and next_core < len(core_questions)
+                and asked_questions == core_questions[:next_core]
+            ):
+                # The facilitator asks the core questions in order, so its
+                # choice is already known
+                fac_out = FacOut(
+                    next_question=core_questions[next_core], should_end=False
+                )
+            else:
+                # Convert transcript to string-based prompt for facilitator
+                fac_prompt = transcript_to_facilitator_prompt(
+                    topic, transcript, core_questions, asked_questions
+                )
 
-            # Run facilitator with string-based prompt
-            fac_run = await Runner.run(facilitator, fac_prompt)
-            fac_out = fac_run.final_output
+                # Run facilitator with string-based prompt
+                fac_run = await Runner.run(facilitator, fac_prompt)
+                fac_out = fac_run.final_output
 
             # Check if we should end
             if fac_out.should_end:
@@ -964,35 +1128,46 @@ async def run_interview(
             question = {"role": "user", "content": fac_out.next_question}
             transcript.append(question)
             asked_questions.append(fac_out.next_question)
+            responses_by_question[fac_out.next_question] = []
 
             # Print facilitator question
             print_facilitator_question(fac_out.next_question)
 
             # Ask each persona
-            for i, agent in enumerate(persona_agents):
-                persona = personas[i]
-                persona_name = persona["name"]
-                persona_description = persona["description"]
-
-                # Run persona agent with string-based prompt
-                run = await ask_persona(
-                    agent,
-                    persona_name,
-                    persona_description,
-                    fac_out.next_question,
-                    transcript,
-                )
-
-                # Record response
-                response = {
-                    "role": "assistant",
-                    "content": run.final_output,
-                    "name": persona_name,
-                }
-                transcript.append(response)
-
-                # Print colored response
-                print_persona_response(persona_name, run.final_output, persona_styles)
+            if concurrent_personas:
+                # Every persona answers before any response is recorded, so
+                # the calls overlap; responses are recorded in persona order
+                with persona_live_view([p["name"] for p in personas]) as live_texts:
+                    runs = await asyncio.gather(
+                        *(
+                            ask_persona(
+                                agent,
+                                persona["name"],
+                                persona["description"],
+                                fac_out.next_question,
+                                live_texts.get(persona["name"]),
+                            )
+                            for agent, persona in zip(persona_agents, personas)
+                        )
+                    )
+                for persona, run in zip(personas, runs):
+                    record_persona_response(fac_out.next_question, persona["name"], run)
+            else:
+                for i, agent in enumerate(persona_agents):
+                    persona = personas[i]
+                    persona_name = persona["name"]
+                    persona_description = persona["description"]
+
+                    # Run persona agent with string-based prompt
+                    with persona_live_view([persona_name]) as live_texts:
+                        run = await ask_persona(
+                            agent,
+                            persona_name,
+                            persona_description,
+                            fac_out.next_question,
+                            live_texts.get(persona_name),
+                        )
+                    record_persona_response(fac_out.next_question, persona_name, run)
 
             # Track follow-ups
             if fac_out.next_question not in core_questions:
@@ -1006,14 +1181,15 @@ async def run_interview(
         # ---------- final analysis ---------- #
         console.print("\n[bold]Generating Analysis...[/bold]")
 
-        # Run sentiment analysis
+        # Run sentiment analysis and generate the summary concurrently; both
+        # only read the finished transcript
         sentiment_prompt = create_sentiment_prompt(transcript, personas)
-        sentiment_run = await Runner.run(sentiment_agent, sentiment_prompt)
-        sentiment_results = sentiment_run.final_output
-
-        # Generate summary
         string_messages = transcript_to_string_message(topic, transcript)
-        sum_run = await Runner.run(summarizer, string_messages)
+        sentiment_run, sum_run = await asyncio.gather(
+            Runner.run(sentiment_agent, sentiment_prompt),
+            Runner.run(summarizer, string_messages),
+        )
+        sentiment_results = sentiment_run.final_output
         report = sum_run.final_output
 
         # Save transcript to file
@@ -1107,16 +1283,9 @@ async def run_batch_interviews(
 # ---------- example invocation ---------- #
 if __name__ == "__main__":
     # os.environ["OPENAI_API_KEY"] = "sk-..."   # put your key here or use .env
-    load_dotenv()
+    from dotenv import load_dotenv
 
-    # Ensure rich is available (nice to have)
-    try:
-        import rich  # noqa: F401
-    except ImportError:
-        print("Installing rich package for text formatting...")
-        os.system("pip install rich")
-        print("Rich package installed. Restarting script...")
-        os.execv(sys.executable, [sys.executable] + sys.argv)
+    load_dotenv()
 
     # ---- Load personas ---- #
     personas_csv_path = os.getenv("PERSONAS_CSV", "personas.csv")